@@ -11,14 +11,84 @@ Usage:
     python scripts/analyze_mutations.py --top 10
 """
 
+from __future__ import annotations
+
 import argparse
-import sqlite3
+import contextlib
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import sqlite3
 
 # Quality thresholds
 MINIMUM_MUTATION_SCORE = 80
 
+# Indexes backing the survived-mutant filter, the joins and the file filter.
+# Mutant(status, line) also carries the rowid (m.id), so it covers both the
+# status GROUP BY and the survived scan; Line/SourceFile are hit by rowid.
+CACHE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_mutant_status_line ON Mutant(status, line)",
+    "CREATE INDEX IF NOT EXISTS idx_line_sourcefile ON Line(sourcefile)",
+    "CREATE INDEX IF NOT EXISTS idx_sourcefile_filename ON SourceFile(filename)",
+)
+
+# Write-side settings for the indexing connection: wait up to 5 s for a
+# running mutmut to release its lock. The journal mode is left alone, since
+# WAL would persist in mutmut's database and leave -wal/-shm files behind.
+WRITE_PRAGMAS = """
+    PRAGMA busy_timeout = 5000;
+"""
+
+# Read-side tuning: in-memory temp storage, 256 MiB mmap, 64 MiB cache. The
+# connection is already mode=ro; query_only would also forbid the TEMP table.
+READ_PRAGMAS = """
+    PRAGMA temp_store = MEMORY;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA cache_size = -65536;
+"""
+
+# Report queries; {file_filter} is replaced by _FILE_FILTER_SQL or "". Keeping
+# the text fixed per filter mode lets sqlite3's statement cache reuse the
+# compiled statements instead of re-parsing them.
+_FILE_FILTER_SQL = "AND (sf.filename = ? OR sf.filename GLOB ?)"
+
+_Q_STATUS = """
+    SELECT m.status, COUNT(*)
+    FROM Mutant m
+    INNER JOIN Line l ON m.line = l.id
+    INNER JOIN SourceFile sf ON l.sourcefile = sf.id
+      {file_filter}
+    GROUP BY m.status
+"""
+
+# Materialize the survived mutants once; both survived projections read it
+_Q_SURVIVED = """
+    CREATE TEMP TABLE survived AS
+    SELECT m.id AS mutant_id, sf.filename, l.line_number
+    FROM Mutant m
+    INNER JOIN Line l ON m.line = l.id
+    INNER JOIN SourceFile sf ON l.sourcefile = sf.id
+    WHERE m.status = 'bad_survived'
+      {file_filter}
+"""
+
+_Q_TOP_FILES = """
+    SELECT filename, COUNT(*) as count
+    FROM survived
+    GROUP BY filename
+    ORDER BY count DESC
+    LIMIT ?
+"""
+
+_Q_SAMPLE = """
+    SELECT mutant_id, filename, line_number
+    FROM survived
+    ORDER BY filename, line_number
+    LIMIT 10
+"""
+
 
 def analyze_cache(
     cache_path: Path, top_files: int = 20, filter_file: str | None = None
@@ -35,124 +105,153 @@ def analyze_cache(
         print("Run mutation tests first: ./scripts/mutation.sh", file=sys.stderr)
         sys.exit(1)
 
-    conn = sqlite3.connect(cache_path)
-    cursor = conn.cursor()
+    # Imported here so `--help` and argument errors skip loading sqlite3
+    import sqlite3
+
+    _ensure_indexes(cache_path)
+
+    # The report only reads, so open read-only to avoid taking write locks
+    # on a cache that a running mutmut may still be updating.
+    uri = f"{cache_path.resolve().as_uri()}?mode=ro"
+    with contextlib.closing(sqlite3.connect(uri, uri=True)) as conn, conn:
+        cursor = conn.cursor()
+        cursor.executescript(READ_PRAGMAS)
+        report = _report(cursor, top_files, filter_file)
+    sys.stdout.write(report)
+
+
+def _ensure_indexes(cache_path: Path) -> None:
+    """Create the query indexes and collect planner statistics once.
+
+    mutmut does not index the columns the report filters and joins on,
+    so without these every query is a full scan of Mutant. This is the
+    only step that writes to the cache; if the cache can't be written
+    (read-only filesystem, lock held by mutmut) the report still runs,
+    just without the indexes.
+
+    Args:
+        cache_path: Path to .mutmut-cache file.
+    """
+    import sqlite3
+
+    try:
+        with contextlib.closing(sqlite3.connect(cache_path)) as conn, conn:
+            cursor = conn.cursor()
+            cursor.executescript(WRITE_PRAGMAS)
+            for statement in CACHE_INDEXES:
+                cursor.execute(statement)
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master"
+                " WHERE type = 'table' AND name = 'sqlite_stat1'"
+            )
+            if cursor.fetchone() is None:
+                cursor.execute("ANALYZE")
+            else:
+                cursor.execute("PRAGMA optimize")
+    except sqlite3.OperationalError as exc:
+        print(f"Warning: could not index cache: {exc}", file=sys.stderr)
+
+
+def _report(cursor: sqlite3.Cursor, top_files: int, filter_file: str | None) -> str:
+    """Run the analysis queries and build the report text.
+
+    Args:
+        cursor: Cursor on an open mutmut cache connection.
+        top_files: Number of top files to show.
+        filter_file: Optional filename to filter results (e.g., "cli.py").
+
+    Returns:
+        The full report, emitted by the caller in a single write.
+    """
+    out: list[str] = []
 
     # Build file filter condition
     file_filter_sql = ""
     file_filter_params: tuple[str, ...] = ()
     if filter_file:
-        # Match any path ending with the specified file
-        file_filter_sql = """
-            AND sf.filename LIKE ?
-        """
-        file_filter_params = (f"%{filter_file}",)
-        print(f"=== Mutmut Cache Analysis (filtered: {filter_file}) ===\n")
+        # Match the file itself or any path whose basename is the file. GLOB
+        # is case-sensitive (like paths) and the exact match can use an index.
+        file_filter_sql = _FILE_FILTER_SQL
+        file_filter_params = (filter_file, f"*/{filter_file}")
+        out.append(f"=== Mutmut Cache Analysis (filtered: {filter_file}) ===\n")
     else:
-        print("=== Mutmut Cache Analysis ===\n")
-
-    # Get total mutants (with optional filter)
-    query = f"""
-        SELECT COUNT(*)
-        FROM Mutant m, Line l, SourceFile sf
-        WHERE m.line = l.id
-          AND l.sourcefile = sf.id
-          {file_filter_sql}
-    """
-    cursor.execute(query, file_filter_params)
-    total = cursor.fetchone()[0]
-    print(f"Total mutants: {total}")
-    print()
-
-    # Get status counts (with optional filter)
-    query = f"""
-        SELECT m.status, COUNT(*)
-        FROM Mutant m, Line l, SourceFile sf
-        WHERE m.line = l.id
-          AND l.sourcefile = sf.id
-          {file_filter_sql}
-        GROUP BY m.status
-    """
-    cursor.execute(query, file_filter_params)
+        out.append("=== Mutmut Cache Analysis ===\n")
+    q_status = _Q_STATUS.format(file_filter=file_filter_sql)
+    q_survived = _Q_SURVIVED.format(file_filter=file_filter_sql)
+
+    # Get status counts (with optional filter). Every mutant falls in exactly
+    # one status group, so their sum is the total and no COUNT(*) is needed.
+    cursor.execute(q_status, file_filter_params)
     status_counts = dict(cursor.fetchall())
+    total = sum(status_counts.values())
     killed = status_counts.get("ok_killed", 0)
     survived = status_counts.get("bad_survived", 0)
     suspicious = status_counts.get("ok_suspicious", 0)
     timeout = status_counts.get("bad_timeout", 0)
     untested = status_counts.get("untested", 0)
 
-    print("Status counts:")
-    for status, count in sorted(status_counts.items()):
-        print(f"  {status}: {count}")
-    print()
+    out.append(f"Total mutants: {total}")
+    out.append("")
+
+    out.append("Status counts:")
+    out.extend(
+        f"  {status}: {count}" for status, count in sorted(status_counts.items())
+    )
+    out.append("")
 
     # Calculate score
     if total > 0:
         tested_total = total - untested
         if tested_total > 0:
-            score = (killed / tested_total) * 100
-            print(f"Mutation Score: {score:.1f}%")
-            print(f"Required: {MINIMUM_MUTATION_SCORE}%")
-            print()
-            print("Breakdown:")
-            killed_pct = killed / tested_total * 100
-            survived_pct = survived / tested_total * 100
-            suspicious_pct = suspicious / tested_total * 100
-            timeout_pct = timeout / tested_total * 100
-            print(f"  Killed: {killed} ({killed_pct:.1f}% of tested)")
-            print(f"  Survived: {survived} ({survived_pct:.1f}% of tested)")
-            print(f"  Suspicious: {suspicious} ({suspicious_pct:.1f}%)")
-            print(f"  Timeout: {timeout} ({timeout_pct:.1f}%)")
-            print(f"  Untested: {untested}")
-            print()
+            inv = 100.0 / tested_total
+            score = killed * inv
+            out.append(f"Mutation Score: {score:.1f}%")
+            out.append(f"Required: {MINIMUM_MUTATION_SCORE}%")
+            out.append("")
+            out.append("Breakdown:")
+            killed_pct = score
+            survived_pct = survived * inv
+            suspicious_pct = suspicious * inv
+            timeout_pct = timeout * inv
+            out.append(f"  Killed: {killed} ({killed_pct:.1f}% of tested)")
+            out.append(f"  Survived: {survived} ({survived_pct:.1f}% of tested)")
+            out.append(f"  Suspicious: {suspicious} ({suspicious_pct:.1f}%)")
+            out.append(f"  Timeout: {timeout} ({timeout_pct:.1f}%)")
+            out.append(f"  Untested: {untested}")
+            out.append("")
 
             if score < MINIMUM_MUTATION_SCORE:
-                gap = int((MINIMUM_MUTATION_SCORE / 100 * tested_total) - killed)
+                # Ceiling division keeps this exact: kills needed to reach the bar
+                gap = -(-MINIMUM_MUTATION_SCORE * tested_total // 100) - killed
                 msg = f"⚠️  Need to kill {gap} more mutants"
                 msg += f" to reach {MINIMUM_MUTATION_SCORE}%"
-                print(msg)
-                print()
+                out.append(msg)
+                out.append("")
 
     # Show files with most survived mutants (with optional filter)
     if survived > 0:
-        print(f"=== Files with Most Survived Mutants (Top {top_files}) ===")
-        query = f"""
-            SELECT sf.filename, COUNT(*) as count
-            FROM Mutant m, Line l, SourceFile sf
-            WHERE m.line = l.id
-              AND l.sourcefile = sf.id
-              AND m.status = "bad_survived"
-              {file_filter_sql}
-            GROUP BY sf.filename
-            ORDER BY count DESC
-            LIMIT ?
-        """
-        cursor.execute(query, (*file_filter_params, top_files))
-        for filename, count in cursor.fetchall():
-            percentage = (count / survived) * 100
-            print(f"  {count:3d} ({percentage:5.1f}%): {filename}")
-        print()
+        out.append(f"=== Files with Most Survived Mutants (Top {top_files}) ===")
+        cursor.execute(q_survived, file_filter_params)
+        cursor.execute(_Q_TOP_FILES, (top_files,))
+        pct = 100.0 / survived
+        out.extend(
+            f"  {count:3d} ({count * pct:5.1f}%): {filename}"
+            for filename, count in cursor
+        )
+        out.append("")
 
         # Show sample of survived mutants (with optional filter)
-        print("Sample of survived mutants (first 10):")
-        query = f"""
-            SELECT m.id, sf.filename, l.line_number
-            FROM Mutant m, Line l, SourceFile sf
-            WHERE m.line = l.id
-              AND l.sourcefile = sf.id
-              AND m.status = "bad_survived"
-              {file_filter_sql}
-            ORDER BY sf.filename, l.line_number
-            LIMIT 10
-        """
-        cursor.execute(query, file_filter_params)
-        for mutant_id, filename, line_number in cursor.fetchall():
-            print(f"  Mutant {mutant_id}: {filename}:{line_number}")
-        print()
-        print("To view a specific mutant: mutmut show <id>")
-        print("To generate HTML report: mutmut html")
-
-    conn.close()
+        out.append("Sample of survived mutants (first 10):")
+        cursor.execute(_Q_SAMPLE)
+        out.extend(
+            f"  Mutant {mutant_id}: {filename}:{line_number}"
+            for mutant_id, filename, line_number in cursor
+        )
+        out.append("")
+        out.append("To view a specific mutant: mutmut show <id>")
+        out.append("To generate HTML report: mutmut html")
+
+    return "\n".join(out) + "\n"
 
 
 def main() -> None:
@@ -4,18 +4,23 @@ import pytest
 
 from weather_friend.models.weather import WeatherData
 
+SAMPLE_WEATHER = WeatherData(
+    city="San Jose",
+    temp_f=68.0,
+    feels_like_f=65.0,
+    humidity=55,
+    description="scattered clouds",
+    wind_speed_mph=8.0,
+    high_f=74.0,
+    low_f=58.0,
+    icon="03d",
+)
 
-@pytest.fixture()
+
+@pytest.fixture(scope="session")
 def sample_weather() -> WeatherData:
-    """Create a sample WeatherData instance for testing."""
-    return WeatherData(
-        city="San Jose",
-        temp_f=68.0,
-        feels_like_f=65.0,
-        humidity=55,
-        description="scattered clouds",
-        wind_speed_mph=8.0,
-        high_f=74.0,
-        low_f=58.0,
-        icon="03d",
-    )
+    """Provide the shared sample WeatherData instance.
+
+    WeatherData is frozen, so a single instance can't leak state between tests.
+    """
+    return SAMPLE_WEATHER
@@ -1,5 +1,6 @@
 """Tests for weather_friend.api module."""
 
+import asyncio
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock
@@ -36,6 +37,7 @@ def message_service() -> MagicMock:
     """Create a MessageService double returning a canned narrative."""
     service = MagicMock()
     service.generate_forecast_message = AsyncMock(return_value=NARRATIVE)
+    service.prewarm = AsyncMock()
     return service
 
 
@@ -202,6 +204,38 @@ class TestWeatherForecast:
         message_service.generate_forecast_message.assert_awaited_once_with(
             sample_weather
         )
+        message_service.prewarm.assert_called_once()
+
+    @pytest.mark.asyncio()
+    async def test_forecast_does_not_wait_for_prewarm(
+        self, weather_service: MagicMock, message_service: MagicMock
+    ) -> None:
+        """Test that a stalled prewarm neither delays nor outlives the app."""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def stalled_prewarm() -> None:
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        message_service.prewarm = stalled_prewarm
+        async with _api_client(weather_service, message_service) as client:
+            resp = await asyncio.wait_for(
+                client.get(
+                    "/api/v1/weather/forecast?location=San Jose,CA",
+                    headers=_auth_headers(),
+                ),
+                timeout=5,
+            )
+
+            assert resp.status == 200
+            assert started.is_set()
+
+        assert cancelled.is_set()
 
     @pytest.mark.asyncio()
     async def test_missing_location(
@@ -215,6 +249,7 @@ class TestWeatherForecast:
             body = await resp.json()
 
         assert body == {"error": "location required"}
+        message_service.prewarm.assert_not_called()
 
     @pytest.mark.asyncio()
     async def test_unknown_location_skips_narrative(
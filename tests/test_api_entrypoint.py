@@ -4,18 +4,20 @@ import asyncio
 import os
 import signal
 import socket
+import sys
 from typing import Any
 from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import aiohttp
 import pytest
 
-from weather_friend.api import main, serve
+from weather_friend.api import _loop_factory, main, serve
 from weather_friend.auth_middleware import SECRET_ENV_VAR
 from weather_friend.config import (
     API_PORT_ENV_VAR,
     DEFAULT_API_HOST,
     DEFAULT_API_PORT,
+    LLM_MODE_ENV_VAR,
     ApiSettings,
 )
 
@@ -29,6 +31,7 @@ def api_env(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("ANTHROPIC_API_KEY", "fake-anthropic-key")
     monkeypatch.setenv(SECRET_ENV_VAR, TEST_SECRET)
     monkeypatch.delenv(API_PORT_ENV_VAR, raising=False)
+    monkeypatch.delenv(LLM_MODE_ENV_VAR, raising=False)
 
 
 def _free_port() -> int:
@@ -92,6 +95,12 @@ class TestApiSettings:
 
         assert ApiSettings.from_env().port == 9010
 
+    def test_from_env_llm_mode(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that WEATHER_FRIEND_LLM_MODE selects the narrative mode."""
+        monkeypatch.setenv(LLM_MODE_ENV_VAR, "auto")
+
+        assert ApiSettings.from_env().llm_mode == "auto"
+
     def test_from_env_missing_vars_lists_all(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -183,11 +192,24 @@ class TestMain:
                 "weather_friend.api.ApiSettings.from_env", return_value=sentinel
             ) as from_env_mock,
             patch("weather_friend.api.serve", new_callable=MagicMock) as serve_mock,
-            patch("weather_friend.api.asyncio.run") as run_mock,
+            patch("weather_friend.api.asyncio.Runner") as runner_cls,
         ):
             main()
 
         dotenv_mock.assert_called_once()
         from_env_mock.assert_called_once()
         serve_mock.assert_called_once_with(sentinel)
-        run_mock.assert_called_once_with(serve_mock.return_value)
+        runner = runner_cls.return_value.__enter__.return_value
+        runner.run.assert_called_once_with(serve_mock.return_value)
+
+    def test_loop_factory_prefers_uvloop(self) -> None:
+        """Test that uvloop's loop factory is used when it is installed."""
+        fake_uvloop = MagicMock()
+
+        with patch.dict(sys.modules, {"uvloop": fake_uvloop}):
+            assert _loop_factory() is fake_uvloop.new_event_loop
+
+    def test_loop_factory_falls_back_without_uvloop(self) -> None:
+        """Test that the default asyncio loop is used without uvloop."""
+        with patch.dict(sys.modules, {"uvloop": None}):
+            assert _loop_factory() is None
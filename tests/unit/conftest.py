@@ -0,0 +1,21 @@
+"""Shared fixtures for weather-friend unit tests."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from weather_friend.services.message_service import MessageService
+
+
+@pytest.fixture()
+def mock_message_service(
+    monkeypatch: pytest.MonkeyPatch,
+) -> tuple[MessageService, AsyncMock]:
+    """Create a MessageService wired to an AsyncMock Anthropic client."""
+    mock_client = AsyncMock()
+    mock_client.with_options = MagicMock(return_value=mock_client)
+    monkeypatch.setattr(
+        "weather_friend.services.message_service.anthropic.AsyncAnthropic",
+        lambda **_: mock_client,
+    )
+    return MessageService(api_key="fake-key"), mock_client
@@ -7,6 +7,7 @@ from weather_friend.config import (
     DEFAULT_API_PORT,
     DEFAULT_CITY_NAME,
     DEFAULT_LATITUDE,
+    DEFAULT_LLM_MODE,
     DEFAULT_LONGITUDE,
     ApiSettings,
 )
@@ -29,6 +30,7 @@ class TestApiSettings:
         assert settings.latitude == DEFAULT_LATITUDE
         assert settings.longitude == DEFAULT_LONGITUDE
         assert settings.city_name == DEFAULT_CITY_NAME
+        assert settings.llm_mode == DEFAULT_LLM_MODE == "always"
 
     def test_direct_construction_with_overrides(self) -> None:
         """Test creating ApiSettings directly with all parameters."""
@@ -45,6 +47,15 @@ class TestApiSettings:
         assert settings.port == 9000
         assert settings.city_name == "New York"
 
+    def test_unknown_llm_mode_rejected(self) -> None:
+        """Test that llm_mode must be one of the known modes."""
+        with pytest.raises(ValueError, match="llm_mode"):
+            ApiSettings(
+                openweather_api_key="w",
+                anthropic_api_key="a",
+                llm_mode="sometimes",
+            )
+
     def test_frozen_dataclass(self) -> None:
         """Test that ApiSettings is immutable (frozen)."""
         settings = ApiSettings(
@@ -53,3 +64,11 @@ class TestApiSettings:
         )
         with pytest.raises(AttributeError, match="cannot assign"):
             settings.port = 9000  # type: ignore[misc]
+
+    def test_uses_slots(self) -> None:
+        """Test that ApiSettings instances carry no per-instance __dict__."""
+        settings = ApiSettings(
+            openweather_api_key="w",
+            anthropic_api_key="a",
+        )
+        assert not hasattr(settings, "__dict__")
@@ -0,0 +1,88 @@
+"""Tests for weather_friend.services.llm_cache module."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from weather_friend.services.llm_cache import InMemoryBackend, LLMCache
+
+
+class TestInMemoryBackend:
+    """Tests for the InMemoryBackend class."""
+
+    @pytest.mark.asyncio()
+    async def test_get_returns_stored_value(self) -> None:
+        """Test that a stored value is returned before it expires."""
+        backend = InMemoryBackend()
+
+        await backend.set("k", "v", ttl_seconds=60)
+
+        assert await backend.get("k") == "v"
+        assert await backend.get("missing") is None
+
+    @pytest.mark.asyncio()
+    async def test_get_drops_expired_entries(self) -> None:
+        """Test that entries past their TTL are treated as absent."""
+        backend = InMemoryBackend()
+        clock = MagicMock(return_value=1000.0)
+
+        with patch("weather_friend.services.llm_cache.time.monotonic", clock):
+            await backend.set("k", "v", ttl_seconds=60)
+            clock.return_value = 1060.0
+            assert await backend.get("k") is None
+
+    @pytest.mark.asyncio()
+    async def test_set_evicts_least_recently_used(self) -> None:
+        """Test that the oldest untouched entry is evicted over maxsize."""
+        backend = InMemoryBackend(maxsize=2)
+        await backend.set("a", "1", ttl_seconds=60)
+        await backend.set("b", "2", ttl_seconds=60)
+        await backend.get("a")
+
+        await backend.set("c", "3", ttl_seconds=60)
+
+        assert await backend.get("a") == "1"
+        assert await backend.get("b") is None
+        assert await backend.get("c") == "3"
+
+
+class TestLLMCache:
+    """Tests for the LLMCache class."""
+
+    def test_make_key_ignores_key_order(self) -> None:
+        """Test that payload keys are canonicalized before hashing."""
+        assert LLMCache.make_key({"a": 1, "b": 2}) == LLMCache.make_key(
+            {"b": 2, "a": 1}
+        )
+        assert LLMCache.make_key({"a": 1}) != LLMCache.make_key({"a": 2})
+
+    @pytest.mark.asyncio()
+    async def test_get_counts_hits_and_misses(self) -> None:
+        """Test that lookups update the hit and miss counters."""
+        cache = LLMCache()
+
+        assert await cache.get({"city": "San Jose"}) is None
+        await cache.set({"city": "San Jose"}, "Sunny")
+        assert await cache.get({"city": "San Jose"}) == "Sunny"
+
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_keeps_falsy_backend(self) -> None:
+        """Test that an empty (falsy) backend is used rather than replaced."""
+        backend = MagicMock()
+        backend.__len__.return_value = 0
+
+        assert LLMCache(backend=backend).backend is backend
+
+    @pytest.mark.asyncio()
+    async def test_set_uses_configured_ttl(self) -> None:
+        """Test that entries are stored with the cache's TTL."""
+        backend = MagicMock()
+        backend.set = MagicMock(side_effect=InMemoryBackend().set)
+        cache = LLMCache(backend=backend, ttl_seconds=120)
+
+        await cache.set({"city": "San Jose"}, "Sunny")
+
+        backend.set.assert_called_once_with(
+            LLMCache.make_key({"city": "San Jose"}), "Sunny", 120
+        )
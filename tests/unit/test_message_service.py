@@ -1,158 +1,278 @@
 """Tests for weather_friend.services.message_service module."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import dataclasses
+from unittest.mock import AsyncMock, MagicMock
 
+import anthropic
 import pytest
 
+from weather_friend.config import DEFAULT_LLM_MODE
 from weather_friend.models.weather import WeatherData
-from weather_friend.services.message_service import (
-    CLAUDE_MODEL,
-    ORACLE_SYSTEM_PROMPT,
-    USER_PROMPT_TEMPLATE,
-    MessageService,
-)
-
-
-def _sample_weather() -> WeatherData:
-    """Create a sample WeatherData for testing."""
-    return WeatherData(
-        city="San Jose",
-        temp_f=68.0,
-        feels_like_f=65.0,
-        humidity=55,
-        description="clear sky",
-        wind_speed_mph=5.0,
-        high_f=74.0,
-        low_f=58.0,
-        icon="01d",
-    )
+from weather_friend.services.message_service import CLAUDE_MODEL, MessageService
+from weather_friend.services.prompts import ORACLE_SYSTEM_BLOCKS
+
+
+def _text_response(text: str) -> MagicMock:
+    """Create a Claude response double carrying a single text block."""
+    text_block = MagicMock()
+    text_block.text = text
+    response = MagicMock()
+    response.content = [text_block]
+    return response
 
 
 class TestMessageService:
     """Tests for the MessageService class."""
 
     @pytest.mark.asyncio()
-    async def test_generate_forecast_calls_claude_api(self) -> None:
+    async def test_generate_forecast_calls_claude_api(
+        self,
+        mock_message_service: tuple[MessageService, AsyncMock],
+        sample_weather: WeatherData,
+    ) -> None:
         """Test that generate_forecast_message calls Claude with correct params."""
-        mock_text_block = MagicMock()
-        mock_text_block.text = "The stars whisper of warmth today."
-        mock_response = MagicMock()
-        mock_response.content = [mock_text_block]
-
-        mock_client = AsyncMock()
-        mock_client.messages.create.return_value = mock_response
+        service, mock_client = mock_message_service
+        mock_client.messages.create.return_value = _text_response(
+            "The stars whisper of warmth today."
+        )
 
-        with patch(
-            "weather_friend.services.message_service.anthropic.AsyncAnthropic",
-            return_value=mock_client,
-        ):
-            service = MessageService(api_key="fake-key")
-            service.client = mock_client
-            message = await service.generate_forecast_message(_sample_weather())
+        message = await service.generate_forecast_message(sample_weather)
 
         assert "The stars whisper of warmth today." in message
         mock_client.messages.create.assert_called_once()
 
     @pytest.mark.asyncio()
-    async def test_generate_forecast_uses_correct_model(self) -> None:
+    async def test_generate_forecast_uses_correct_model(
+        self,
+        mock_message_service: tuple[MessageService, AsyncMock],
+        sample_weather: WeatherData,
+    ) -> None:
         """Test that the service calls the correct Claude model."""
-        mock_text_block = MagicMock()
-        mock_text_block.text = "Forecast text"
-        mock_response = MagicMock()
-        mock_response.content = [mock_text_block]
+        service, mock_client = mock_message_service
+        mock_client.messages.create.return_value = _text_response("Forecast text")
 
-        mock_client = AsyncMock()
-        mock_client.messages.create.return_value = mock_response
-
-        with patch(
-            "weather_friend.services.message_service.anthropic.AsyncAnthropic",
-            return_value=mock_client,
-        ):
-            service = MessageService(api_key="fake-key")
-            service.client = mock_client
-            await service.generate_forecast_message(_sample_weather())
+        await service.generate_forecast_message(sample_weather)
 
         call_kwargs = mock_client.messages.create.call_args.kwargs
         assert call_kwargs["model"] == CLAUDE_MODEL
         assert call_kwargs["max_tokens"] == 300
-        assert call_kwargs["system"] == ORACLE_SYSTEM_PROMPT
+        assert call_kwargs["system"] == ORACLE_SYSTEM_BLOCKS
 
     @pytest.mark.asyncio()
-    async def test_generate_forecast_formats_user_prompt(self) -> None:
+    async def test_generate_forecast_formats_user_prompt(
+        self,
+        mock_message_service: tuple[MessageService, AsyncMock],
+        sample_weather: WeatherData,
+    ) -> None:
         """Test that weather data is formatted into the user prompt."""
-        mock_text_block = MagicMock()
-        mock_text_block.text = "Forecast"
-        mock_response = MagicMock()
-        mock_response.content = [mock_text_block]
-
-        mock_client = AsyncMock()
-        mock_client.messages.create.return_value = mock_response
+        service, mock_client = mock_message_service
+        mock_client.messages.create.return_value = _text_response("Forecast")
 
-        with patch(
-            "weather_friend.services.message_service.anthropic.AsyncAnthropic",
-            return_value=mock_client,
-        ):
-            service = MessageService(api_key="fake-key")
-            service.client = mock_client
-            await service.generate_forecast_message(_sample_weather())
+        await service.generate_forecast_message(sample_weather)
 
         call_kwargs = mock_client.messages.create.call_args.kwargs
         user_content = call_kwargs["messages"][0]["content"]
         assert "San Jose" in user_content
         assert "68" in user_content
-        assert "clear sky" in user_content
+        assert "scattered clouds" in user_content
 
     @pytest.mark.asyncio()
-    async def test_generate_forecast_api_error(self) -> None:
+    async def test_generate_forecast_api_error(
+        self,
+        mock_message_service: tuple[MessageService, AsyncMock],
+        sample_weather: WeatherData,
+    ) -> None:
         """Test that API errors are re-raised."""
-        import anthropic
-
-        mock_client = AsyncMock()
+        service, mock_client = mock_message_service
         mock_client.messages.create.side_effect = anthropic.APIConnectionError(
             request=MagicMock(),
         )
 
-        with patch(
-            "weather_friend.services.message_service.anthropic.AsyncAnthropic",
-            return_value=mock_client,
-        ):
-            service = MessageService(api_key="fake-key")
-            service.client = mock_client
-
-            with pytest.raises(anthropic.APIError):
-                await service.generate_forecast_message(_sample_weather())
+        with pytest.raises(anthropic.APIError):
+            await service.generate_forecast_message(sample_weather)
 
     @pytest.mark.asyncio()
-    async def test_generate_forecast_empty_response(self) -> None:
+    async def test_generate_forecast_empty_response(
+        self,
+        mock_message_service: tuple[MessageService, AsyncMock],
+        sample_weather: WeatherData,
+    ) -> None:
         """Test that an empty response raises ValueError."""
+        service, mock_client = mock_message_service
         mock_response = MagicMock()
         mock_response.content = []
-
-        mock_client = AsyncMock()
         mock_client.messages.create.return_value = mock_response
 
-        with patch(
+        with pytest.raises(ValueError, match="empty response"):
+            await service.generate_forecast_message(sample_weather)
+
+    @pytest.mark.asyncio()
+    async def test_prewarm_lists_models(
+        self, mock_message_service: tuple[MessageService, AsyncMock]
+    ) -> None:
+        """Test that prewarm issues a cheap request to open a connection."""
+        service, mock_client = mock_message_service
+
+        await service.prewarm()
+
+        mock_client.with_options.assert_called_once_with(timeout=5.0, max_retries=0)
+        mock_client.models.list.assert_awaited_once_with(limit=1)
+
+    @pytest.mark.asyncio()
+    async def test_prewarm_skipped_when_templates_may_answer(
+        self, mock_message_service: tuple[MessageService, AsyncMock]
+    ) -> None:
+        """Test that auto mode does not prewarm a connection it may not use."""
+        service, mock_client = mock_message_service
+        service.llm_mode = "auto"
+
+        await service.prewarm()
+
+        mock_client.models.list.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_prewarm_swallows_api_errors(
+        self, mock_message_service: tuple[MessageService, AsyncMock]
+    ) -> None:
+        """Test that a failed prewarm does not raise."""
+        service, mock_client = mock_message_service
+        mock_client.models.list.side_effect = anthropic.APIConnectionError(
+            request=MagicMock(),
+        )
+
+        await service.prewarm()
+
+        mock_client.models.list.assert_awaited_once()
+
+    @pytest.mark.asyncio()
+    async def test_generate_forecast_reuses_cached_message(
+        self,
+        mock_message_service: tuple[MessageService, AsyncMock],
+        sample_weather: WeatherData,
+    ) -> None:
+        """Test that near-identical weather is served from the response cache."""
+        service, mock_client = mock_message_service
+        mock_client.messages.create.return_value = _text_response("Cached oracle")
+        nudged = dataclasses.replace(sample_weather, temp_f=sample_weather.temp_f + 0.3)
+
+        first = await service.generate_forecast_message(sample_weather)
+        second = await service.generate_forecast_message(nudged)
+
+        assert first == second == "Cached oracle"
+        mock_client.messages.create.assert_awaited_once()
+        assert (service.cache.hits, service.cache.misses) == (1, 1)
+
+    @pytest.mark.asyncio()
+    async def test_generate_forecast_cache_misses_on_changed_weather(
+        self,
+        mock_message_service: tuple[MessageService, AsyncMock],
+        sample_weather: WeatherData,
+    ) -> None:
+        """Test that different conditions call Claude again."""
+        service, mock_client = mock_message_service
+        mock_client.messages.create.return_value = _text_response("Forecast")
+        rainy = dataclasses.replace(sample_weather, description="light rain")
+
+        await service.generate_forecast_message(sample_weather)
+        await service.generate_forecast_message(rainy)
+
+        assert mock_client.messages.create.await_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_generate_forecast_does_not_cache_errors(
+        self,
+        mock_message_service: tuple[MessageService, AsyncMock],
+        sample_weather: WeatherData,
+    ) -> None:
+        """Test that a failed request leaves nothing in the cache."""
+        service, mock_client = mock_message_service
+        mock_client.messages.create.side_effect = [
+            anthropic.APIConnectionError(request=MagicMock()),
+            _text_response("Recovered"),
+        ]
+
+        with pytest.raises(anthropic.APIError):
+            await service.generate_forecast_message(sample_weather)
+        message = await service.generate_forecast_message(sample_weather)
+
+        assert message == "Recovered"
+
+    @pytest.mark.asyncio()
+    async def test_auto_mode_uses_template_for_common_weather(
+        self,
+        mock_message_service: tuple[MessageService, AsyncMock],
+        sample_weather: WeatherData,
+    ) -> None:
+        """Test that auto mode answers common weather without Claude."""
+        service, mock_client = mock_message_service
+        service.llm_mode = "auto"
+
+        message = await service.generate_forecast_message(sample_weather)
+
+        assert sample_weather.city in message
+        mock_client.messages.create.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_auto_mode_calls_claude_for_unusual_weather(
+        self,
+        mock_message_service: tuple[MessageService, AsyncMock],
+        sample_weather: WeatherData,
+    ) -> None:
+        """Test that auto mode falls through to Claude outside the buckets."""
+        service, mock_client = mock_message_service
+        service.llm_mode = "auto"
+        mock_client.messages.create.return_value = _text_response("Storm oracle")
+        storm = dataclasses.replace(
+            sample_weather, icon="11d", description="thunderstorm"
+        )
+
+        message = await service.generate_forecast_message(storm)
+
+        assert message == "Storm oracle"
+
+    @pytest.mark.asyncio()
+    async def test_never_mode_does_not_call_claude(
+        self,
+        mock_message_service: tuple[MessageService, AsyncMock],
+        sample_weather: WeatherData,
+    ) -> None:
+        """Test that never mode uses the generic template and skips prewarm."""
+        service, mock_client = mock_message_service
+        service.llm_mode = "never"
+        storm = dataclasses.replace(
+            sample_weather, icon="11d", description="thunderstorm"
+        )
+
+        await service.prewarm()
+        message = await service.generate_forecast_message(storm)
+
+        assert "thunderstorm" in message
+        mock_client.messages.create.assert_not_called()
+        mock_client.models.list.assert_not_called()
+
+    def test_client_retries_transient_errors(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the Anthropic client is built with extra retries."""
+        constructor = MagicMock()
+        monkeypatch.setattr(
             "weather_friend.services.message_service.anthropic.AsyncAnthropic",
-            return_value=mock_client,
-        ):
-            service = MessageService(api_key="fake-key")
-            service.client = mock_client
-
-            with pytest.raises(ValueError, match="empty response"):
-                await service.generate_forecast_message(_sample_weather())
-
-    def test_system_prompt_contains_personality(self) -> None:
-        """Test that the system prompt defines the Oracle personality."""
-        assert "Oracle of the Skies" in ORACLE_SYSTEM_PROMPT
-        assert "clothing" in ORACLE_SYSTEM_PROMPT
-        assert "ALL genders" in ORACLE_SYSTEM_PROMPT
-
-    def test_user_prompt_template_has_placeholders(self) -> None:
-        """Test that the user prompt template has all required placeholders."""
-        assert "{city}" in USER_PROMPT_TEMPLATE
-        assert "{temp_f" in USER_PROMPT_TEMPLATE
-        assert "{humidity}" in USER_PROMPT_TEMPLATE
-        assert "{wind_speed_mph" in USER_PROMPT_TEMPLATE
+            constructor,
+        )
+
+        MessageService(api_key="fake-key")
+
+        constructor.assert_called_once_with(api_key="fake-key", max_retries=3)
+
+    def test_init_rejects_unknown_llm_mode(self) -> None:
+        """Test that an llm_mode outside LLM_MODES fails at construction."""
+        with pytest.raises(ValueError, match="llm_mode must be one of"):
+            MessageService(api_key="fake-key", llm_mode="sometimes")
+
+    def test_init_defaults_llm_mode(self) -> None:
+        """Test that llm_mode defaults to the configured default mode."""
+        service = MessageService(api_key="fake-key")
+        assert service.llm_mode == DEFAULT_LLM_MODE
 
     def test_model_constant_is_defined(self) -> None:
         """Test that the Claude model ID is a module-level constant."""
@@ -39,11 +39,34 @@ class TestWeatherData:
         )
         assert weather.temp_range_summary == "59\u00b0F \u2013 76\u00b0F"
 
+    @pytest.mark.parametrize("first_low", [0.0, -0.0])
+    def test_temp_range_summary_ignores_sign_of_zero(self, first_low: float) -> None:
+        """Test that -0.0 and 0.0 lows format identically in either order."""
+        summaries = [
+            WeatherData(
+                city="Test",
+                temp_f=10.0,
+                feels_like_f=5.0,
+                humidity=50,
+                description="clear",
+                wind_speed_mph=5.0,
+                high_f=15.0,
+                low_f=low,
+                icon="01d",
+            ).temp_range_summary
+            for low in (first_low, -first_low)
+        ]
+        assert summaries == ["0\u00b0F \u2013 15\u00b0F"] * 2
+
     def test_frozen_dataclass(self, sample_weather: WeatherData) -> None:
         """Test that WeatherData is immutable (frozen)."""
         with pytest.raises(AttributeError, match="cannot assign"):
             sample_weather.city = "Other City"  # type: ignore[misc]
 
+    def test_uses_slots(self, sample_weather: WeatherData) -> None:
+        """Test that WeatherData instances carry no per-instance __dict__."""
+        assert not hasattr(sample_weather, "__dict__")
+
     def test_equality(self) -> None:
         """Test that two WeatherData with same values are equal."""
         first = WeatherData(
@@ -0,0 +1,57 @@
+"""Tests for weather_friend.services.prompts module."""
+
+from weather_friend.models.weather import WeatherData
+from weather_friend.services.prompts import (
+    ORACLE_FORMAT_RULES,
+    ORACLE_PERSONA,
+    ORACLE_SYSTEM_BLOCKS,
+    ORACLE_SYSTEM_PROMPT,
+    render_user_prompt,
+)
+
+_REQUIRED_SYSTEM_TOKENS = frozenset({"Oracle of the Skies", "clothing", "ALL genders"})
+_EXPECTED_USER_PROMPT_LINES = (
+    "Here is today's weather for San Jose:",
+    "- Temperature: 68\u00b0F (feels like 65\u00b0F)",
+    "- Conditions: scattered clouds",
+    "- High/Low: 74\u00b0F / 58\u00b0F",
+    "- Humidity: 55%",
+    "- Wind: 8 mph",
+)
+
+
+class TestPrompts:
+    """Tests for the Oracle prompt constants and renderer."""
+
+    def test_system_prompt_contains_personality(self) -> None:
+        """Test that the system prompt defines the Oracle personality."""
+        missing = {t for t in _REQUIRED_SYSTEM_TOKENS if t not in ORACLE_SYSTEM_PROMPT}
+        assert not missing
+
+    def test_render_user_prompt_includes_weather(
+        self, sample_weather: WeatherData
+    ) -> None:
+        """Test that the user prompt renders every weather field."""
+        prompt = render_user_prompt(sample_weather)
+
+        missing = [line for line in _EXPECTED_USER_PROMPT_LINES if line not in prompt]
+        assert not missing
+
+    def test_system_blocks_cache_persona_and_format_separately(self) -> None:
+        """Test that persona and format rules are separate cache breakpoints."""
+        assert ORACLE_SYSTEM_BLOCKS == [
+            {
+                "type": "text",
+                "text": ORACLE_PERSONA,
+                "cache_control": {"type": "ephemeral"},
+            },
+            {
+                "type": "text",
+                "text": ORACLE_FORMAT_RULES,
+                "cache_control": {"type": "ephemeral"},
+            },
+        ]
+
+    def test_system_prompt_joins_persona_and_format(self) -> None:
+        """Test that the full prompt text is the two blocks in order."""
+        assert f"{ORACLE_PERSONA}\n\n{ORACLE_FORMAT_RULES}" == ORACLE_SYSTEM_PROMPT
@@ -0,0 +1,91 @@
+"""Tests for weather_friend.services.rule_based_oracle module."""
+
+import dataclasses
+
+import pytest
+
+from weather_friend.models.weather import WeatherData
+from weather_friend.services import rule_based_oracle
+
+
+class TestRender:
+    """Tests for the bucketed template renderer."""
+
+    @pytest.mark.parametrize(
+        ("overrides", "expected"),
+        [
+            ({"icon": "13d", "temp_f": 30.0}, "waterproof boots"),
+            ({"icon": "10d", "description": "light rain"}, "umbrella"),
+            ({"icon": "01n", "temp_f": 38.0}, "warm coat"),
+            ({"icon": "01d", "temp_f": 92.0, "humidity": 70}, "breathable"),
+            ({}, "light jacket"),
+        ],
+    )
+    def test_common_weather_renders_bucket_advice(
+        self,
+        sample_weather: WeatherData,
+        overrides: dict[str, object],
+        expected: str,
+    ) -> None:
+        """Test that each common bucket yields its clothing advice."""
+        weather = dataclasses.replace(sample_weather, **overrides)  # type: ignore[arg-type]
+
+        message = rule_based_oracle.render(weather)
+
+        assert message is not None
+        assert expected in message
+        assert weather.city in message
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"icon": "11d", "description": "thunderstorm"},
+            {"wind_speed_mph": 25.0},
+            {"temp_f": 105.0},
+            {"temp_f": 10.0, "icon": "01d"},
+            {"temp_f": 52.0, "icon": "50d", "description": "mist"},
+            {"temp_f": 90.0, "humidity": 70, "icon": "11d"},
+            {"temp_f": 90.0, "humidity": 70, "icon": "50d", "description": "haze"},
+        ],
+    )
+    def test_unusual_weather_falls_through(
+        self, sample_weather: WeatherData, overrides: dict[str, object]
+    ) -> None:
+        """Test that conditions outside the buckets return None."""
+        weather = dataclasses.replace(sample_weather, **overrides)  # type: ignore[arg-type]
+
+        assert rule_based_oracle.render(weather) is None
+
+    def test_render_is_deterministic(self, sample_weather: WeatherData) -> None:
+        """Test that the same reading always renders the same message."""
+        assert rule_based_oracle.render(sample_weather) == rule_based_oracle.render(
+            sample_weather
+        )
+
+
+class TestRenderFallback:
+    """Tests for the generic temperature-band renderer."""
+
+    @pytest.mark.parametrize(
+        ("temp_f", "expected"),
+        [
+            (10.0, "Bundle up"),
+            (55.0, "Layer up"),
+            (70.0, "Dress light"),
+            (105.0, "Keep cool"),
+        ],
+    )
+    def test_advice_follows_temperature(
+        self, sample_weather: WeatherData, temp_f: float, expected: str
+    ) -> None:
+        """Test that fallback advice is chosen by temperature band."""
+        weather = dataclasses.replace(sample_weather, temp_f=temp_f)
+
+        assert expected in rule_based_oracle.render_fallback(weather)
+
+    @pytest.mark.parametrize("icon", ["09d", "10n", "11d"])
+    def test_rain_adds_umbrella(self, sample_weather: WeatherData, icon: str) -> None:
+        """Test that rainy and stormy fallback messages mention an umbrella."""
+        weather = dataclasses.replace(sample_weather, icon=icon, temp_f=10.0)
+
+        assert "umbrella" in rule_based_oracle.render_fallback(weather)
@@ -1,11 +1,13 @@
 """Tests for weather_friend.services.weather_service module."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
+import orjson
 import pytest
 
-from weather_friend.services.weather_service import WeatherService
+from weather_friend.services.weather_service import BASE_URL, WeatherService
 
 
 def _make_service() -> WeatherService:
@@ -31,18 +33,16 @@ def _sample_api_response() -> dict:
 
 
 def _mock_client(response: MagicMock) -> AsyncMock:
-    """Create an async-context-manager httpx client double."""
+    """Create an httpx client double whose get() returns the response."""
     client = AsyncMock()
     client.get.return_value = response
-    client.__aenter__ = AsyncMock(return_value=client)
-    client.__aexit__ = AsyncMock(return_value=False)
     return client
 
 
 def _mock_response(payload: dict) -> MagicMock:
     """Create a successful httpx response double with a JSON payload."""
     response = MagicMock()
-    response.json.return_value = payload
+    response.content = orjson.dumps(payload)
     response.raise_for_status = MagicMock()
     return response
 
@@ -69,13 +69,11 @@ class TestWeatherService:
         """Test successful weather fetch returns correct WeatherData."""
         service = _make_service()
         mock_response = MagicMock()
-        mock_response.json.return_value = _sample_api_response()
+        mock_response.content = orjson.dumps(_sample_api_response())
         mock_response.raise_for_status = MagicMock()
 
         mock_client = AsyncMock()
         mock_client.get.return_value = mock_response
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
 
         with patch(
             "weather_friend.services.weather_service.httpx.AsyncClient",
@@ -98,13 +96,11 @@ class TestWeatherService:
         """Test that the API call includes correct query parameters."""
         service = _make_service()
         mock_response = MagicMock()
-        mock_response.json.return_value = _sample_api_response()
+        mock_response.content = orjson.dumps(_sample_api_response())
         mock_response.raise_for_status = MagicMock()
 
         mock_client = AsyncMock()
         mock_client.get.return_value = mock_response
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
 
         with patch(
             "weather_friend.services.weather_service.httpx.AsyncClient",
@@ -123,22 +119,66 @@ class TestWeatherService:
     async def test_get_current_weather_uses_explicit_timeout(self) -> None:
         """Test that the httpx client is created with an explicit timeout."""
         service = _make_service()
-        mock_response = MagicMock()
-        mock_response.json.return_value = _sample_api_response()
-        mock_response.raise_for_status = MagicMock()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
 
-        mock_client = AsyncMock()
-        mock_client.get.return_value = mock_response
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
+        with patch(
+            "weather_friend.services.weather_service.httpx.AsyncClient",
+            return_value=mock_client,
+        ) as mock_constructor:
+            await service.get_current_weather()
+
+        mock_constructor.assert_called_once()
+        assert mock_constructor.call_args.kwargs["timeout"] == 10.0
+
+    @pytest.mark.asyncio()
+    async def test_pooled_client_keeps_idle_connections_alive(self) -> None:
+        """Test that idle connections outlive the default keepalive expiry."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+
+        with patch(
+            "weather_friend.services.weather_service.httpx.AsyncClient",
+            return_value=mock_client,
+        ) as mock_constructor:
+            await service.get_current_weather()
+
+        limits = mock_constructor.call_args.kwargs["limits"]
+        assert limits.keepalive_expiry == 300.0
+
+    @pytest.mark.asyncio()
+    async def test_requests_reuse_one_pooled_client(self) -> None:
+        """Test that repeated fetches share a single httpx client."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+
+        with patch(
+            "weather_friend.services.weather_service.httpx.AsyncClient",
+            return_value=mock_client,
+        ) as mock_constructor:
+            await service.aopen()
+            await service.get_current_weather()
+            await service.get_weather_for_location("Portland,OR")
+
+        mock_constructor.assert_called_once()
+        assert mock_client.get.await_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_aclose_closes_pooled_client(self) -> None:
+        """Test that aclose closes the client and a later fetch reopens one."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
 
         with patch(
             "weather_friend.services.weather_service.httpx.AsyncClient",
             return_value=mock_client,
         ) as mock_constructor:
             await service.get_current_weather()
+            await service.aclose()
+            await service.aclose()
+            await service.get_weather_for_location("Portland,OR")
 
-        mock_constructor.assert_called_once_with(timeout=10.0)
+        mock_client.aclose.assert_awaited_once()
+        assert mock_constructor.call_count == 2
 
     @pytest.mark.asyncio()
     async def test_get_current_weather_http_error(self) -> None:
@@ -153,8 +193,6 @@ class TestWeatherService:
 
         mock_client = AsyncMock()
         mock_client.get.return_value = mock_response
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
 
         with (
             patch(
@@ -172,8 +210,6 @@ class TestWeatherService:
 
         mock_client = AsyncMock()
         mock_client.get.side_effect = httpx.RequestError("Connection failed")
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
 
         with (
             patch(
@@ -185,6 +221,135 @@ class TestWeatherService:
             await service.get_current_weather()
 
 
+class TestCurrentWeatherCache:
+    """Tests for the get_current_weather TTL cache and request coalescing."""
+
+    @pytest.mark.asyncio()
+    async def test_repeat_call_within_ttl_uses_cache(self) -> None:
+        """Test that a second call inside the TTL skips the HTTP request."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+
+        with patch(
+            "weather_friend.services.weather_service.httpx.AsyncClient",
+            return_value=mock_client,
+        ):
+            first = await service.get_current_weather()
+            second = await service.get_current_weather()
+
+        assert first is second
+        mock_client.get.assert_awaited_once()
+
+    @pytest.mark.asyncio()
+    async def test_expired_cache_refetches(self) -> None:
+        """Test that a call after the TTL has elapsed fetches again."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+
+        clock = MagicMock(return_value=1000.0)
+
+        with (
+            patch(
+                "weather_friend.services.weather_service.httpx.AsyncClient",
+                return_value=mock_client,
+            ),
+            patch("weather_friend.services.weather_service.time.monotonic", clock),
+        ):
+            await service.get_current_weather()
+            clock.return_value = 1299.0
+            await service.get_current_weather()
+            clock.return_value = 1300.0
+            await service.get_current_weather()
+
+        assert mock_client.get.await_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_cache_ttl_is_configurable(self) -> None:
+        """Test that a custom cache_ttl controls when readings expire."""
+        service = WeatherService(
+            api_key="fake-key",
+            lat=37.3382,
+            lon=-121.8863,
+            city="San Jose",
+            cache_ttl=60.0,
+        )
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+        clock = MagicMock(return_value=1000.0)
+
+        with (
+            patch(
+                "weather_friend.services.weather_service.httpx.AsyncClient",
+                return_value=mock_client,
+            ),
+            patch("weather_friend.services.weather_service.time.monotonic", clock),
+        ):
+            await service.get_current_weather()
+            clock.return_value = 1060.0
+            await service.get_current_weather()
+
+        assert mock_client.get.await_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_invalidate_forces_refetch(self) -> None:
+        """Test that invalidate() makes the next call hit the API."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+
+        with patch(
+            "weather_friend.services.weather_service.httpx.AsyncClient",
+            return_value=mock_client,
+        ):
+            await service.get_current_weather()
+            service.invalidate()
+            await service.get_current_weather()
+
+        assert mock_client.get.await_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_concurrent_callers_share_one_request(self) -> None:
+        """Test that simultaneous cache misses issue a single HTTP request."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+
+        async def slow_get(*args: object, **kwargs: object) -> MagicMock:
+            await asyncio.sleep(0)
+            return _mock_response(_sample_api_response())
+
+        mock_client.get.side_effect = slow_get
+
+        with patch(
+            "weather_friend.services.weather_service.httpx.AsyncClient",
+            return_value=mock_client,
+        ):
+            results = await asyncio.gather(
+                *(service.get_current_weather() for _ in range(5))
+            )
+
+        assert all(result is results[0] for result in results)
+        mock_client.get.assert_awaited_once()
+
+    @pytest.mark.asyncio()
+    async def test_errors_are_not_cached(self) -> None:
+        """Test that a failed fetch is retried on the next call."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+        mock_client.get.side_effect = [
+            httpx.RequestError("Connection failed"),
+            _mock_response(_sample_api_response()),
+        ]
+
+        with patch(
+            "weather_friend.services.weather_service.httpx.AsyncClient",
+            return_value=mock_client,
+        ):
+            with pytest.raises(httpx.RequestError):
+                await service.get_current_weather()
+            weather = await service.get_current_weather()
+
+        assert weather.city == "San Jose"
+        assert mock_client.get.await_count == 2
+
+
 class TestGetWeatherForLocation:
     """Tests for WeatherService.get_weather_for_location."""
 
@@ -277,6 +442,10 @@ class TestGetWeatherForLocation:
                 "weather_friend.services.weather_service.httpx.AsyncClient",
                 return_value=mock_client,
             ),
+            patch(
+                "weather_friend.services.weather_service.asyncio.sleep",
+                new=AsyncMock(),
+            ),
             pytest.raises(httpx.HTTPStatusError),
         ):
             await service.get_weather_for_location("Portland,OR")
@@ -287,8 +456,6 @@ class TestGetWeatherForLocation:
         service = _make_service()
         mock_client = AsyncMock()
         mock_client.get.side_effect = httpx.RequestError("Connection failed")
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
 
         with (
             patch(
@@ -298,3 +465,357 @@ class TestGetWeatherForLocation:
             pytest.raises(httpx.RequestError),
         ):
             await service.get_weather_for_location("Portland,OR")
+
+
+class TestLocationWeatherCache:
+    """Tests for the get_weather_for_location TTL cache and coalescing."""
+
+    @pytest.mark.asyncio()
+    async def test_repeat_call_within_ttl_uses_cache(self) -> None:
+        """Test that a second lookup inside the TTL skips the HTTP request."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+
+        with patch(
+            "weather_friend.services.weather_service.httpx.AsyncClient",
+            return_value=mock_client,
+        ):
+            first = await service.get_weather_for_location("Portland,OR")
+            second = await service.get_weather_for_location("  portland,or ")
+
+        assert first is second
+        mock_client.get.assert_awaited_once()
+
+    @pytest.mark.asyncio()
+    async def test_locations_are_cached_separately(self) -> None:
+        """Test that each distinct location gets its own upstream request."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+
+        with patch(
+            "weather_friend.services.weather_service.httpx.AsyncClient",
+            return_value=mock_client,
+        ):
+            portland = await service.get_weather_for_location("Portland,OR")
+            austin = await service.get_weather_for_location("Austin,TX")
+
+        assert portland.city == "Portland,OR"
+        assert austin.city == "Austin,TX"
+        assert mock_client.get.await_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_expired_entry_refetches(self) -> None:
+        """Test that a lookup after the TTL has elapsed fetches again."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+        clock = MagicMock(return_value=1000.0)
+
+        with (
+            patch(
+                "weather_friend.services.weather_service.httpx.AsyncClient",
+                return_value=mock_client,
+            ),
+            patch("weather_friend.services.weather_service.time.monotonic", clock),
+        ):
+            await service.get_weather_for_location("Portland,OR")
+            clock.return_value = 1299.0
+            await service.get_weather_for_location("Portland,OR")
+            clock.return_value = 1300.0
+            await service.get_weather_for_location("Portland,OR")
+
+        assert mock_client.get.await_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_concurrent_callers_share_one_request(self) -> None:
+        """Test that simultaneous misses for one location fetch once."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+
+        async def slow_get(*args: object, **kwargs: object) -> MagicMock:
+            await asyncio.sleep(0)
+            return _mock_response(_sample_api_response())
+
+        mock_client.get.side_effect = slow_get
+
+        with patch(
+            "weather_friend.services.weather_service.httpx.AsyncClient",
+            return_value=mock_client,
+        ):
+            results = await asyncio.gather(
+                *(service.get_weather_for_location("Portland,OR") for _ in range(5))
+            )
+
+        assert all(result is results[0] for result in results)
+        mock_client.get.assert_awaited_once()
+        assert service._location_locks == {}
+
+    @pytest.mark.asyncio()
+    async def test_errors_are_not_cached(self) -> None:
+        """Test that a failed lookup is retried on the next call."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+        mock_client.get.side_effect = [
+            httpx.RequestError("Connection failed"),
+            _mock_response(_sample_api_response()),
+        ]
+
+        with patch(
+            "weather_friend.services.weather_service.httpx.AsyncClient",
+            return_value=mock_client,
+        ):
+            with pytest.raises(httpx.RequestError):
+                await service.get_weather_for_location("Portland,OR")
+            weather = await service.get_weather_for_location("Portland,OR")
+
+        assert weather.city == "Portland,OR"
+        assert mock_client.get.await_count == 2
+        assert service._location_locks == {}
+
+    @pytest.mark.asyncio()
+    async def test_cache_ttl_is_configurable(self) -> None:
+        """Test that a custom cache_ttl controls when locations expire."""
+        service = WeatherService(
+            api_key="fake-key",
+            lat=37.3382,
+            lon=-121.8863,
+            city="San Jose",
+            cache_ttl=60.0,
+        )
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+        clock = MagicMock(return_value=1000.0)
+
+        with (
+            patch(
+                "weather_friend.services.weather_service.httpx.AsyncClient",
+                return_value=mock_client,
+            ),
+            patch("weather_friend.services.weather_service.time.monotonic", clock),
+        ):
+            await service.get_weather_for_location("Portland,OR")
+            clock.return_value = 1059.0
+            await service.get_weather_for_location("Portland,OR")
+            clock.return_value = 1060.0
+            await service.get_weather_for_location("Portland,OR")
+
+        assert mock_client.get.await_count == 2
+
+    @pytest.mark.asyncio()
+    async def test_invalidate_forces_refetch(self) -> None:
+        """Test that invalidate() drops cached locations too."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+
+        with patch(
+            "weather_friend.services.weather_service.httpx.AsyncClient",
+            return_value=mock_client,
+        ):
+            await service.get_current_weather()
+            await service.get_weather_for_location("Portland,OR")
+            service.invalidate()
+            await service.get_current_weather()
+            await service.get_weather_for_location("Portland,OR")
+
+        assert mock_client.get.await_count == 4
+
+    @pytest.mark.asyncio()
+    async def test_oldest_location_is_evicted_when_full(self) -> None:
+        """Test that the cache drops its oldest entry past the size limit."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+
+        with (
+            patch(
+                "weather_friend.services.weather_service.httpx.AsyncClient",
+                return_value=mock_client,
+            ),
+            patch("weather_friend.services.weather_service._LOCATION_CACHE_MAXSIZE", 2),
+        ):
+            for location in ("Portland,OR", "Austin,TX", "Boise,ID"):
+                await service.get_weather_for_location(location)
+            await service.get_weather_for_location("Boise,ID")
+            await service.get_weather_for_location("Portland,OR")
+
+        assert mock_client.get.await_count == 4
+
+
+def _error_response(status: int, headers: dict[str, str] | None = None) -> MagicMock:
+    """Create an httpx response double whose raise_for_status() fails."""
+    error = httpx.Response(
+        status, headers=headers, request=httpx.Request("GET", BASE_URL)
+    )
+    response = MagicMock()
+    response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        "error", request=error.request, response=error
+    )
+    return response
+
+
+def _raise_or_return(outcome: Exception | MagicMock) -> MagicMock:
+    """Raise outcome if it is an exception, otherwise return it."""
+    if isinstance(outcome, Exception):
+        raise outcome
+    return outcome
+
+
+class TestFetchRetry:
+    """Tests for retrying transient OpenWeatherMap failures."""
+
+    @pytest.mark.asyncio()
+    async def test_transport_error_is_retried(self) -> None:
+        """Test that a dropped connection is retried after a backoff."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+        mock_client.get.side_effect = [
+            httpx.ConnectError("reset"),
+            _mock_response(_sample_api_response()),
+        ]
+        sleep = AsyncMock()
+
+        with (
+            patch(
+                "weather_friend.services.weather_service.httpx.AsyncClient",
+                return_value=mock_client,
+            ),
+            patch("weather_friend.services.weather_service.asyncio.sleep", sleep),
+        ):
+            weather = await service.get_current_weather()
+
+        assert weather.city == "San Jose"
+        assert mock_client.get.await_count == 2
+        sleep.assert_awaited_once()
+        assert 0.0 <= sleep.await_args_list[0].args[0] <= 0.5
+
+    @pytest.mark.asyncio()
+    async def test_retry_after_header_is_honored(self) -> None:
+        """Test that a 503 waits for the server's Retry-After delay."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+        mock_client.get.side_effect = [
+            _error_response(503, {"Retry-After": "2"}),
+            _mock_response(_sample_api_response()),
+        ]
+        sleep = AsyncMock()
+
+        with (
+            patch(
+                "weather_friend.services.weather_service.httpx.AsyncClient",
+                return_value=mock_client,
+            ),
+            patch("weather_friend.services.weather_service.asyncio.sleep", sleep),
+        ):
+            await service.get_current_weather()
+
+        sleep.assert_awaited_once_with(2.0)
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        "response",
+        [
+            _error_response(401),
+            _error_response(429, {"Retry-After": "3600"}),
+        ],
+    )
+    async def test_non_transient_errors_are_not_retried(
+        self, response: MagicMock
+    ) -> None:
+        """Test that client errors and long Retry-After waits fail fast."""
+        service = _make_service()
+        mock_client = _mock_client(response)
+        sleep = AsyncMock()
+
+        with (
+            patch(
+                "weather_friend.services.weather_service.httpx.AsyncClient",
+                return_value=mock_client,
+            ),
+            patch("weather_friend.services.weather_service.asyncio.sleep", sleep),
+            pytest.raises(httpx.HTTPStatusError),
+        ):
+            await service.get_current_weather()
+
+        mock_client.get.assert_awaited_once()
+        sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize(
+        ("failure", "expected"),
+        [
+            (httpx.ConnectError("reset"), httpx.ConnectError),
+            (
+                _error_response(502, {"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}),
+                httpx.HTTPStatusError,
+            ),
+        ],
+    )
+    async def test_gives_up_after_max_attempts(
+        self, failure: Exception | MagicMock, expected: type[Exception]
+    ) -> None:
+        """Test that persistent failures are re-raised after four attempts."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+        mock_client.get.side_effect = lambda *_, **__: _raise_or_return(failure)
+        sleep = AsyncMock()
+
+        with (
+            patch(
+                "weather_friend.services.weather_service.httpx.AsyncClient",
+                return_value=mock_client,
+            ),
+            patch("weather_friend.services.weather_service.asyncio.sleep", sleep),
+            pytest.raises(expected),
+        ):
+            await service.get_current_weather()
+
+        assert mock_client.get.await_count == 4
+        assert sleep.await_count == 3
+
+    @pytest.mark.asyncio()
+    async def test_location_lookup_is_retried(self) -> None:
+        """Test that get_weather_for_location retries a transient 503."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+        mock_client.get.side_effect = [
+            _error_response(503),
+            _mock_response(_sample_api_response()),
+        ]
+        sleep = AsyncMock()
+
+        with (
+            patch(
+                "weather_friend.services.weather_service.httpx.AsyncClient",
+                return_value=mock_client,
+            ),
+            patch("weather_friend.services.weather_service.asyncio.sleep", sleep),
+        ):
+            weather = await service.get_weather_for_location("Portland,OR")
+
+        assert weather.city == "Portland,OR"
+        assert mock_client.get.await_count == 2
+        sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio()
+    async def test_concurrent_callers_share_retries(self) -> None:
+        """Test that callers waiting on a retried fetch don't fetch again."""
+        service = _make_service()
+        mock_client = _mock_client(_mock_response(_sample_api_response()))
+        mock_client.get.side_effect = [
+            httpx.ConnectError("reset"),
+            _mock_response(_sample_api_response()),
+        ]
+
+        with (
+            patch(
+                "weather_friend.services.weather_service.httpx.AsyncClient",
+                return_value=mock_client,
+            ),
+            patch(
+                "weather_friend.services.weather_service._retry_delay",
+                return_value=0.0,
+            ),
+        ):
+            results = await asyncio.gather(
+                *(service.get_weather_for_location("Portland,OR") for _ in range(3))
+            )
+
+        assert all(result is results[0] for result in results)
+        assert mock_client.get.await_count == 2
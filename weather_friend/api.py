@@ -24,7 +24,7 @@ from weather_friend.services.message_service import MessageService
 from weather_friend.services.weather_service import WeatherService
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Coroutine
 
     from weather_friend.models.weather import WeatherData
 
@@ -38,6 +38,9 @@ WEATHER_SERVICE_KEY: web.AppKey[WeatherService] = web.AppKey(
 MESSAGE_SERVICE_KEY: web.AppKey[MessageService] = web.AppKey(
     "message_service", MessageService
 )
+BACKGROUND_TASKS_KEY: web.AppKey[set[asyncio.Task[None]]] = web.AppKey(
+    "background_tasks", set
+)
 
 
 @web.middleware
@@ -77,29 +80,41 @@ def _bad_request(message: str) -> web.HTTPBadRequest:
     )
 
 
-async def _weather_for_request(request: web.Request) -> tuple[WeatherData, str]:
-    """Resolve the request's location query into weather data.
+def _requested_location(request: web.Request) -> str:
+    """Read the required location query param from a request.
 
     Args:
         request: The incoming HTTP request.
 
     Returns:
-        A tuple of the fetched WeatherData and the requested location.
+        The requested location string.
 
     Raises:
-        web.HTTPBadRequest: If the location param is missing or the
-            weather service rejects it.
+        web.HTTPBadRequest: If the location param is missing or empty.
     """
     location = request.query.get("location")
     if not location:
         raise _bad_request("location required")
+    return location
+
+
+async def _weather_for_location(request: web.Request, location: str) -> WeatherData:
+    """Resolve a requested location into weather data.
+
+    Args:
+        request: The incoming HTTP request.
+        location: The location string the caller asked for.
+
+    Returns:
+        The fetched WeatherData.
+
+    Raises:
+        web.HTTPBadRequest: If the weather service rejects the location.
+    """
     try:
-        weather = await request.app[WEATHER_SERVICE_KEY].get_weather_for_location(
-            location
-        )
+        return await request.app[WEATHER_SERVICE_KEY].get_weather_for_location(location)
     except ValueError as exc:
         raise _bad_request(str(exc)) from exc
-    return weather, location
 
 
 def _serialize_weather(weather: WeatherData, location: str) -> dict[str, Any]:
@@ -135,7 +150,8 @@ async def get_weather_data(request: web.Request) -> web.Response:
     Returns:
         A JSON response with the serialized weather data.
     """
-    weather, location = await _weather_for_request(request)
+    location = _requested_location(request)
+    weather = await _weather_for_location(request, location)
     return web.json_response(_serialize_weather(weather, location))
 
 
@@ -149,15 +165,43 @@ async def get_weather_forecast(request: web.Request) -> web.Response:
         A JSON response with the serialized weather data and the
         generated forecast narrative.
     """
-    weather, location = await _weather_for_request(request)
-    narrative = await request.app[MESSAGE_SERVICE_KEY].generate_forecast_message(
-        weather
-    )
+    location = _requested_location(request)
+    message_service = request.app[MESSAGE_SERVICE_KEY]
+    # Warm the Claude connection while the weather fetch is in flight, but
+    # never wait on it: cached or templated narratives don't need Claude.
+    _spawn(request.app, message_service.prewarm())
+    weather = await _weather_for_location(request, location)
+    narrative = await message_service.generate_forecast_message(weather)
     payload = _serialize_weather(weather, location)
     payload["narrative"] = narrative
     return web.json_response(payload)
 
 
+def _spawn(app: web.Application, coro: Coroutine[Any, Any, None]) -> None:
+    """Run a fire-and-forget coroutine, keeping a reference until it ends.
+
+    Args:
+        app: Application whose background task set holds the task.
+        coro: Coroutine to run in the background.
+    """
+    tasks = app[BACKGROUND_TASKS_KEY]
+    task = asyncio.create_task(coro)
+    tasks.add(task)
+    task.add_done_callback(tasks.discard)
+
+
+async def _cancel_background_tasks(app: web.Application) -> None:
+    """Cancel background tasks still running at shutdown.
+
+    Args:
+        app: Application whose background tasks are cancelled.
+    """
+    tasks = app[BACKGROUND_TASKS_KEY]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
 async def healthz(request: web.Request) -> web.Response:
     """Serve GET /healthz: unauthenticated liveness probe.
 
@@ -186,6 +230,8 @@ def build_app(
     api = web.Application(middlewares=[_require_bearer_auth])
     api[WEATHER_SERVICE_KEY] = weather_service
     api[MESSAGE_SERVICE_KEY] = message_service
+    api[BACKGROUND_TASKS_KEY] = set()
+    api.on_cleanup.append(_cancel_background_tasks)
     api.router.add_get("/weather/data", get_weather_data)
     api.router.add_get("/weather/forecast", get_weather_forecast)
 
@@ -224,8 +270,9 @@ async def serve(settings: ApiSettings, *, stop: asyncio.Event | None = None) ->
     """Run the standalone API until stopped, then clean up the runner.
 
     Builds the weather and message services from the given settings,
-    serves the API, and waits. SIGINT/SIGTERM set the stop event so a
-    ``systemctl --user stop`` shuts the server down gracefully.
+    opens the weather service's pooled HTTP client, serves the API, and
+    waits. SIGINT/SIGTERM set the stop event so a ``systemctl --user
+    stop`` shuts the server down gracefully.
 
     Args:
         settings: Environment-derived configuration for the API process.
@@ -239,7 +286,10 @@ async def serve(settings: ApiSettings, *, stop: asyncio.Event | None = None) ->
         lon=settings.longitude,
         city=settings.city_name,
     )
-    message_service = MessageService(api_key=settings.anthropic_api_key)
+    message_service = MessageService(
+        api_key=settings.anthropic_api_key, llm_mode=settings.llm_mode
+    )
+    await weather_service.aopen()
     runner = await start_api(
         weather_service, message_service, settings.host, settings.port
     )
@@ -253,9 +303,25 @@ async def serve(settings: ApiSettings, *, stop: asyncio.Event | None = None) ->
         for sig in handled_signals:
             loop.remove_signal_handler(sig)
         await runner.cleanup()
+        await weather_service.aclose()
         logger.info("weather-friend API shut down cleanly")
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Pick the event loop implementation for the API process.
+
+    Returns:
+        uvloop's loop factory when uvloop is installed (it is markedly
+        faster for socket-heavy asyncio code), otherwise None so asyncio
+        uses its default loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 def main() -> None:
     """Run the standalone weather-friend API (``python -m weather_friend.api``).
 
@@ -267,7 +333,8 @@ def main() -> None:
         level=logging.INFO,
         format="%(asctime)s %(levelname)s %(name)s: %(message)s",
     )
-    asyncio.run(serve(ApiSettings.from_env()))
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        runner.run(serve(ApiSettings.from_env()))
 
 
 if __name__ == "__main__":
@@ -14,8 +14,15 @@ DEFAULT_API_HOST: Final[str] = "127.0.0.1"
 DEFAULT_API_PORT: Final[int] = 8002
 API_PORT_ENV_VAR: Final[str] = "WEATHER_FRIEND_API_PORT"
 
+# "always" sends every forecast to Claude, "auto" answers common weather
+# from rule-based templates and uses Claude for the rest, "never" uses
+# templates only.
+LLM_MODES: Final[frozenset[str]] = frozenset({"auto", "always", "never"})
+DEFAULT_LLM_MODE: Final[str] = "always"
+LLM_MODE_ENV_VAR: Final[str] = "WEATHER_FRIEND_LLM_MODE"
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ApiSettings:
     """Settings for the standalone RubotPaul API process.
 
@@ -30,6 +37,7 @@ class ApiSettings:
         latitude: Location latitude for weather queries.
         longitude: Location longitude for weather queries.
         city_name: Display name for the forecast city.
+        llm_mode: When to call Claude for narratives (see LLM_MODES).
     """
 
     openweather_api_key: str
@@ -39,16 +47,22 @@ class ApiSettings:
     latitude: float = DEFAULT_LATITUDE
     longitude: float = DEFAULT_LONGITUDE
     city_name: str = DEFAULT_CITY_NAME
+    llm_mode: str = DEFAULT_LLM_MODE
 
     def __post_init__(self) -> None:
         """Validate field ranges after initialization.
 
         Raises:
-            ValueError: If port is outside the valid TCP range.
+            ValueError: If port is outside the valid TCP range or llm_mode
+                is not one of LLM_MODES.
         """
         if not 1 <= self.port <= 65535:
             msg = f"port must be 1-65535, got {self.port}"
             raise ValueError(msg)
+        if self.llm_mode not in LLM_MODES:
+            modes = ", ".join(sorted(LLM_MODES))
+            msg = f"llm_mode must be one of {modes}, got {self.llm_mode!r}"
+            raise ValueError(msg)
 
     @classmethod
     def from_env(cls) -> "ApiSettings":
@@ -64,7 +78,8 @@ class ApiSettings:
         Raises:
             RuntimeError: If any required environment variable is unset,
                 naming every missing variable.
-            ValueError: If WEATHER_FRIEND_API_PORT is not a valid port.
+            ValueError: If WEATHER_FRIEND_API_PORT is not a valid port or
+                WEATHER_FRIEND_LLM_MODE is not a known mode.
         """
         required = ("OPENWEATHER_API_KEY", "ANTHROPIC_API_KEY", SECRET_ENV_VAR)
         missing = [name for name in required if not os.environ.get(name)]
@@ -81,4 +96,5 @@ class ApiSettings:
             openweather_api_key=os.environ["OPENWEATHER_API_KEY"],
             anthropic_api_key=os.environ["ANTHROPIC_API_KEY"],
             port=port,
+            llm_mode=os.environ.get(LLM_MODE_ENV_VAR, DEFAULT_LLM_MODE),
         )
@@ -1,9 +1,16 @@
 """Weather data models."""
 
+import functools
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@functools.lru_cache(maxsize=256)
+def _format_temp_range(low_f: float, high_f: float) -> str:
+    """Format a low/high temperature pair, memoized per pair."""
+    return f"{low_f:.0f}\u00b0F \u2013 {high_f:.0f}\u00b0F"
+
+
+@dataclass(frozen=True, slots=True)
 class WeatherData:
     """Immutable weather data from OpenWeatherMap.
 
@@ -32,4 +39,6 @@ class WeatherData:
     @property
     def temp_range_summary(self) -> str:
         """Format the daily temperature range as a human-readable string."""
-        return f"{self.low_f:.0f}\u00b0F \u2013 {self.high_f:.0f}\u00b0F"
+        # -0.0 and 0.0 share a cache slot but format differently; adding
+        # 0.0 folds -0.0 into 0.0 so the output never depends on call order.
+        return _format_temp_range(self.low_f + 0.0, self.high_f + 0.0)
@@ -0,0 +1,146 @@
+"""Response cache for generated forecast messages.
+
+Forecast inputs change slowly, so the same rounded weather tends to recur
+within an hour. Caching the generated text by a digest of those inputs
+skips the Claude round trip (and its cost) on repeats.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Final, Protocol
+
+DEFAULT_TTL_SECONDS: Final[float] = 3600.0
+DEFAULT_MAXSIZE: Final[int] = 256
+
+
+class CacheBackend(Protocol):
+    """Storage interface for LLMCache entries."""
+
+    async def get(self, key: str) -> str | None:
+        """Return the stored value for key, or None if absent or expired."""
+        ...
+
+    async def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        """Store value under key for ttl_seconds."""
+        ...
+
+
+class InMemoryBackend:
+    """Process-local LRU backend with per-entry expiry.
+
+    Operations never await, so they are atomic on the event loop and need
+    no lock.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        """Initialize the backend.
+
+        Args:
+            maxsize: Maximum number of entries kept; the least recently
+                used entry is evicted first.
+        """
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    async def get(self, key: str) -> str | None:
+        """Return the stored value for key, or None if absent or expired.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The cached value, or None.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        """Store value under key, evicting the oldest entries over maxsize.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+            ttl_seconds: Seconds until the entry expires.
+        """
+        self._entries[key] = (value, time.monotonic() + ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+
+class LLMCache:
+    """Cache of generated text keyed by a digest of its request payload.
+
+    Attributes:
+        backend: Storage backend for entries.
+        ttl_seconds: Lifetime of each cached entry.
+        hits: Number of lookups served from the cache.
+        misses: Number of lookups that found nothing.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            backend: Storage backend; defaults to an InMemoryBackend.
+            ttl_seconds: Lifetime of each cached entry.
+        """
+        self.backend: CacheBackend = (
+            backend if backend is not None else InMemoryBackend()
+        )
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(payload: dict[str, Any]) -> str:
+        """Derive a stable cache key from a JSON-serializable payload.
+
+        Args:
+            payload: Request features that determine the response.
+
+        Returns:
+            A SHA-256 hex digest of the canonical JSON encoding.
+        """
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    async def get(self, payload: dict[str, Any]) -> str | None:
+        """Look up the cached response for a payload.
+
+        Args:
+            payload: Request features that determine the response.
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        value = await self.backend.get(self.make_key(payload))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, payload: dict[str, Any], value: str) -> None:
+        """Cache the response for a payload.
+
+        Args:
+            payload: Request features that determine the response.
+            value: The generated response to cache.
+        """
+        await self.backend.set(self.make_key(payload), value, self.ttl_seconds)
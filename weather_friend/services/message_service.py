@@ -1,46 +1,33 @@
 """Generates weather forecast messages with outfit advice via Claude API."""
 
+import hashlib
 import logging
+from typing import Any
 
 import anthropic
 
+from weather_friend.config import DEFAULT_LLM_MODE, LLM_MODES
 from weather_friend.models.weather import WeatherData
+from weather_friend.services import rule_based_oracle
+from weather_friend.services.llm_cache import LLMCache
+from weather_friend.services.prompts import (
+    ORACLE_SYSTEM_BLOCKS,
+    ORACLE_SYSTEM_PROMPT,
+    render_user_prompt,
+)
 
 logger = logging.getLogger(__name__)
 
 CLAUDE_MODEL = "claude-sonnet-4-5-20250929"
+# The SDK retries connection errors, 408/409/429 and 5xx with jittered
+# backoff (honoring Retry-After); allow one more attempt than its default.
+_CLAUDE_MAX_RETRIES = 3
+# A prewarm is only worth it if it finishes before the real request
+_PREWARM_TIMEOUT_SECONDS = 5.0
 
-ORACLE_SYSTEM_PROMPT = (
-    "You are the Oracle of the Skies \u2014 a friendly weather guide with a touch "
-    "of mystical charm who posts daily forecasts in a Discord server.\n\n"
-    "Your personality:\n"
-    "- Warm and approachable with a light mystical flair\n"
-    "- Occasional celestial or elemental nods (the stars suggest, "
-    "the winds carry, etc.) but don't overdo it\n"
-    "- Include one relevant emoji per sentence (no more)\n\n"
-    "Your PRIMARY purpose is practical clothing advice:\n"
-    "- List specific clothing suggestions suitable for ALL genders\n"
-    "- Cover layers, footwear, and accessories as the weather warrants\n"
-    "- Be concrete: name actual items (light jacket, sunglasses, umbrella, "
-    "breathable t-shirt, sneakers, etc.)\n"
-    "- Adapt suggestions to the temperature range and conditions\n\n"
-    "Message format (keep it to 4-6 sentences total):\n"
-    "1. A brief weather summary with a hint of Oracle personality\n"
-    "2. Clear clothing recommendations (the main event)\n"
-    "3. A short, warm sign-off (a small blessing or encouraging word)\n\n"
-    "Strike a balance: be helpful first, charming second. "
-    "Think friendly neighborhood fortune teller, not Shakespeare."
-)
-
-USER_PROMPT_TEMPLATE = (
-    "Here is today's weather for {city}:\n\n"
-    "- Temperature: {temp_f:.0f}\u00b0F (feels like {feels_like_f:.0f}\u00b0F)\n"
-    "- Conditions: {description}\n"
-    "- High/Low: {high_f:.0f}\u00b0F / {low_f:.0f}\u00b0F\n"
-    "- Humidity: {humidity}%\n"
-    "- Wind: {wind_speed_mph:.0f} mph\n\n"
-    "Generate a morning weather forecast with practical clothing suggestions."
-)
+# Folded into every response-cache key so editing the prompt invalidates
+# messages generated under the old one.
+_SYSTEM_PROMPT_DIGEST = hashlib.sha256(ORACLE_SYSTEM_PROMPT.encode()).hexdigest()
 
 
 class MessageService:
@@ -48,19 +35,65 @@ class MessageService:
 
     Attributes:
         client: Async Anthropic client instance.
+        cache: Response cache keyed on rounded weather features.
+        llm_mode: "always" to generate every message with Claude, "auto" to
+            use rule-based templates for common weather, or "never" to use
+            templates only.
     """
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        cache: LLMCache | None = None,
+        llm_mode: str = DEFAULT_LLM_MODE,
+    ) -> None:
         """Initialize the message service.
 
         Args:
             api_key: Anthropic API key for Claude access.
+            cache: Response cache; defaults to an in-memory LLMCache.
+            llm_mode: When to call Claude: "always", "auto", or "never".
+
+        Raises:
+            ValueError: If llm_mode is not one of LLM_MODES.
         """
-        self.client = anthropic.AsyncAnthropic(api_key=api_key)
+        if llm_mode not in LLM_MODES:
+            modes = ", ".join(sorted(LLM_MODES))
+            msg = f"llm_mode must be one of {modes}, got {llm_mode!r}"
+            raise ValueError(msg)
+        self.client = anthropic.AsyncAnthropic(
+            api_key=api_key, max_retries=_CLAUDE_MAX_RETRIES
+        )
+        self.cache = cache if cache is not None else LLMCache()
+        self.llm_mode = llm_mode
+
+    async def prewarm(self) -> None:
+        """Open a connection to the Claude API ahead of a forecast request.
+
+        Issues a cheap models listing so the TCP/TLS handshake can overlap
+        other work (such as the weather fetch). Best-effort: failures are
+        logged and ignored, since the real request will surface them.
+        Skipped unless llm_mode is "always", since other modes may answer
+        from templates without calling Claude at all.
+        """
+        if self.llm_mode != "always":
+            return
+        client = self.client.with_options(
+            timeout=_PREWARM_TIMEOUT_SECONDS, max_retries=0
+        )
+        try:
+            await client.models.list(limit=1)
+        except anthropic.APIError:
+            logger.debug("Claude API prewarm failed", exc_info=True)
 
     async def generate_forecast_message(self, weather: WeatherData) -> str:
         """Generate a forecast message with outfit advice from weather data.
 
+        Unless llm_mode is "always", common weather is answered from
+        rule-based templates first. Generated messages are cached on the
+        rounded weather features, so near-identical conditions reuse the
+        earlier message instead of calling Claude again.
+
         Args:
             weather: Current weather data to transform into a message.
 
@@ -71,22 +104,26 @@ class MessageService:
             anthropic.APIError: If the Claude API request fails.
             ValueError: If Claude returns an empty response.
         """
-        user_prompt = USER_PROMPT_TEMPLATE.format(
-            city=weather.city,
-            temp_f=weather.temp_f,
-            feels_like_f=weather.feels_like_f,
-            description=weather.description,
-            high_f=weather.high_f,
-            low_f=weather.low_f,
-            humidity=weather.humidity,
-            wind_speed_mph=weather.wind_speed_mph,
-        )
+        if self.llm_mode != "always":
+            template = rule_based_oracle.render(weather)
+            if template is not None:
+                return template
+            if self.llm_mode == "never":
+                return rule_based_oracle.render_fallback(weather)
+
+        cache_payload = _cache_payload(weather)
+        cached = await self.cache.get(cache_payload)
+        if cached is not None:
+            logger.debug("Forecast message cache hit for %s", weather.city)
+            return cached
+
+        user_prompt = render_user_prompt(weather)
 
         try:
             response = await self.client.messages.create(
                 model=CLAUDE_MODEL,
                 max_tokens=300,
-                system=ORACLE_SYSTEM_PROMPT,
+                system=ORACLE_SYSTEM_BLOCKS,
                 messages=[{"role": "user", "content": user_prompt}],
             )
         except anthropic.APIError:
@@ -97,4 +134,32 @@ class MessageService:
             msg = "Claude returned an empty response"
             raise ValueError(msg)
 
-        return response.content[0].text  # type: ignore[union-attr]
+        message: str = response.content[0].text  # type: ignore[union-attr]
+        await self.cache.set(cache_payload, message)
+        return message
+
+
+def _cache_payload(weather: WeatherData) -> dict[str, Any]:
+    """Build the response-cache payload for a weather reading.
+
+    Values are rounded to the precision the prompt shows (and humidity to
+    5% buckets) so readings that would yield the same message share a key.
+
+    Args:
+        weather: Weather data the message is generated from.
+
+    Returns:
+        A JSON-serializable dict identifying the request.
+    """
+    return {
+        "city": weather.city,
+        "temp_f": round(weather.temp_f),
+        "feels_like_f": round(weather.feels_like_f),
+        "description": weather.description,
+        "high_f": round(weather.high_f),
+        "low_f": round(weather.low_f),
+        "humidity": weather.humidity // 5,
+        "wind_speed_mph": round(weather.wind_speed_mph),
+        "model": CLAUDE_MODEL,
+        "system": _SYSTEM_PROMPT_DIGEST,
+    }
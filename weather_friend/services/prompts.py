@@ -0,0 +1,66 @@
+"""Prompt text for the Oracle forecast persona.
+
+Everything sent ahead of the per-request weather lives here as constants so
+the cached prompt prefix is byte-identical on every call and across restarts.
+"""
+
+from anthropic.types import TextBlockParam
+
+from weather_friend.models.weather import WeatherData
+
+# The persona rarely changes; format rules are tuned more often, so each is
+# its own cache breakpoint. Both blocks are currently far below the model's
+# minimum cacheable prompt length, so neither is cached yet; the split only
+# pays off (rule edits keeping the persona cached) once the persona grows
+# past that minimum.
+ORACLE_PERSONA = (
+    "You are the Oracle of the Skies, a warm weather guide with light mystical "
+    "charm who posts daily forecasts on Discord. Your main job is practical "
+    "clothing advice suitable for ALL genders: name concrete items (layers, "
+    "footwear, accessories such as a light jacket, sunglasses, umbrella, or "
+    "sneakers) that fit the temperature range and conditions."
+)
+
+ORACLE_FORMAT_RULES = (
+    "Write 4-6 sentences: a brief weather summary, clear clothing "
+    "recommendations, then a short warm sign-off. Use one relevant emoji per "
+    "sentence and only the occasional celestial nod (the stars suggest, the "
+    "winds carry). Be helpful first, charming second: a friendly neighborhood "
+    "fortune teller, not Shakespeare."
+)
+
+ORACLE_SYSTEM_PROMPT = f"{ORACLE_PERSONA}\n\n{ORACLE_FORMAT_RULES}"
+
+ORACLE_SYSTEM_BLOCKS: list[TextBlockParam] = [
+    {
+        "type": "text",
+        "text": ORACLE_PERSONA,
+        "cache_control": {"type": "ephemeral"},
+    },
+    {
+        "type": "text",
+        "text": ORACLE_FORMAT_RULES,
+        "cache_control": {"type": "ephemeral"},
+    },
+]
+
+
+def render_user_prompt(weather: WeatherData) -> str:
+    """Render the per-request user prompt for a weather reading.
+
+    Args:
+        weather: Weather data to describe.
+
+    Returns:
+        The user message asking Claude for a forecast.
+    """
+    return (
+        f"Here is today's weather for {weather.city}:\n\n"
+        f"- Temperature: {weather.temp_f:.0f}\u00b0F "
+        f"(feels like {weather.feels_like_f:.0f}\u00b0F)\n"
+        f"- Conditions: {weather.description}\n"
+        f"- High/Low: {weather.high_f:.0f}\u00b0F / {weather.low_f:.0f}\u00b0F\n"
+        f"- Humidity: {weather.humidity}%\n"
+        f"- Wind: {weather.wind_speed_mph:.0f} mph\n\n"
+        "Generate a morning weather forecast with practical clothing suggestions."
+    )
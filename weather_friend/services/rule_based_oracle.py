@@ -0,0 +1,163 @@
+"""Template forecasts for common weather, generated without calling Claude.
+
+Most days fall into a handful of buckets (rain, snow, cold and clear, hot
+and humid, mild). For those, a canned Oracle message is indistinguishable
+in usefulness from a generated one and costs nothing. Unusual conditions
+(storms, high wind, extreme temperatures) fall through to Claude.
+"""
+
+from typing import Final
+
+from weather_friend.models.weather import WeatherData
+
+# OpenWeatherMap icon codes: the first two characters name the condition
+# group, the last is day/night. See https://openweathermap.org/weather-conditions
+_CLEAR: Final[str] = "01"
+_CLOUDY: Final[frozenset[str]] = frozenset({"02", "03", "04"})
+_RAIN: Final[frozenset[str]] = frozenset({"09", "10"})
+_THUNDERSTORM: Final[str] = "11"
+_SNOW: Final[str] = "13"
+
+_MIN_TEMPLATE_TEMP_F: Final[float] = 20.0
+_MAX_TEMPLATE_TEMP_F: Final[float] = 100.0
+_MAX_TEMPLATE_WIND_MPH: Final[float] = 20.0
+
+_OPENERS: Final[tuple[str, ...]] = (
+    "\U0001f52e The Oracle has consulted the skies.",
+    "\u2728 The winds have whispered their plans for today.",
+    "\U0001f319 The stars have spoken about the day ahead.",
+)
+_BLESSINGS: Final[tuple[str, ...]] = (
+    "May your path be bright and your layers just right! \U0001f31f",
+    "Go forth well dressed and well blessed! \U0001f64f",
+    "The skies wish you a splendid day! \U0001f308",
+)
+
+_RAIN_ADVICE: Final[str] = (
+    "\u2614 Grab an umbrella or a hooded rain jacket, wear water-resistant "
+    "shoes or boots, and skip anything suede."
+)
+_SNOW_ADVICE: Final[str] = (
+    "\u2744\ufe0f Bundle up in an insulated coat over a warm sweater, with "
+    "waterproof boots, gloves, a hat, and a scarf."
+)
+_COLD_CLEAR_ADVICE: Final[str] = (
+    "\U0001f9e5 Wear a warm coat over a sweater or fleece, long pants, "
+    "closed-toe shoes, and sunglasses for the bright winter sun."
+)
+_HOT_HUMID_ADVICE: Final[str] = (
+    "\U0001f975 Choose loose, breathable cotton or linen, shorts or a light "
+    "skirt, sandals, a sun hat, and keep a water bottle close."
+)
+_MILD_ADVICE: Final[str] = (
+    "\U0001f455 A t-shirt or light long-sleeve top with jeans and sneakers "
+    "is perfect, with a light jacket or cardigan for the cooler hours."
+)
+
+# Generic advice by temperature band, for when no bucket matches and
+# Claude is disabled. Bands are (upper bound exclusive, advice).
+_FALLBACK_ADVICE: Final[tuple[tuple[float, str], ...]] = (
+    (
+        50.0,
+        "\U0001f9e3 Bundle up: a warm coat, a sweater or fleece underneath, "
+        "long pants, and closed-toe shoes.",
+    ),
+    (
+        65.0,
+        "\U0001f9e5 Layer up: a light jacket or hoodie over a t-shirt, jeans, "
+        "and comfortable sneakers.",
+    ),
+    (
+        80.0,
+        "\U0001f45f Dress light: a breathable t-shirt, jeans or shorts, "
+        "sneakers, and sunglasses.",
+    ),
+    (
+        float("inf"),
+        "\U0001f31e Keep cool: loose, breathable clothing, shorts or a light "
+        "skirt, sandals, sunglasses, and plenty of water.",
+    ),
+)
+
+
+def render(weather: WeatherData) -> str | None:
+    """Render a template forecast if the weather fits a common bucket.
+
+    Args:
+        weather: Current weather data.
+
+    Returns:
+        A forecast message with clothing advice, or None if the conditions
+        are unusual enough to warrant a generated message.
+    """
+    advice = _bucket_advice(weather)
+    if advice is None:
+        return None
+    return _compose(weather, advice)
+
+
+def render_fallback(weather: WeatherData) -> str:
+    """Render a generic template forecast for any weather.
+
+    Args:
+        weather: Current weather data.
+
+    Returns:
+        A forecast message with temperature-based clothing advice.
+    """
+    advice = next(text for bound, text in _FALLBACK_ADVICE if weather.temp_f < bound)
+    group = weather.icon[:2]
+    if group in _RAIN or group == _THUNDERSTORM:
+        advice += " Bring an umbrella, too. \u2614"
+    return _compose(weather, advice)
+
+
+def _bucket_advice(weather: WeatherData) -> str | None:
+    """Return the clothing advice for the weather's bucket, if any.
+
+    Args:
+        weather: Current weather data.
+
+    Returns:
+        Bucket-specific advice, or None if no bucket applies.
+    """
+    if not _MIN_TEMPLATE_TEMP_F <= weather.temp_f <= _MAX_TEMPLATE_TEMP_F:
+        return None
+    if weather.wind_speed_mph >= _MAX_TEMPLATE_WIND_MPH:
+        return None
+    group = weather.icon[:2]
+    fair = group == _CLEAR or group in _CLOUDY
+    if group == _SNOW:
+        return _SNOW_ADVICE
+    if group in _RAIN:
+        return _RAIN_ADVICE
+    if group == _CLEAR and weather.temp_f < 45.0:
+        return _COLD_CLEAR_ADVICE
+    if fair and weather.temp_f >= 85.0 and weather.humidity >= 60:
+        return _HOT_HUMID_ADVICE
+    if fair and 60.0 <= weather.temp_f <= 78.0:
+        return _MILD_ADVICE
+    return None
+
+
+def _compose(weather: WeatherData, advice: str) -> str:
+    """Assemble the opener, summary, advice, and blessing into a message.
+
+    The opener and blessing are picked by temperature rather than at
+    random, so the same reading always renders the same message.
+
+    Args:
+        weather: Current weather data.
+        advice: Clothing advice sentence(s).
+
+    Returns:
+        The complete forecast message.
+    """
+    pick = round(weather.temp_f)
+    return (
+        f"{_OPENERS[pick % len(_OPENERS)]} "
+        f"{weather.city} is at {weather.temp_f:.0f}\u00b0F "
+        f"(feels like {weather.feels_like_f:.0f}\u00b0F) with "
+        f"{weather.description}, ranging {weather.temp_range_summary} today. "
+        f"{advice} {_BLESSINGS[pick % len(_BLESSINGS)]}"
+    )
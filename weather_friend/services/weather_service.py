@@ -1,8 +1,13 @@
 """Fetches weather data from OpenWeatherMap API."""
 
+import asyncio
 import logging
+import operator
+import random
+import time
 
 import httpx
+import orjson
 
 from weather_friend.models.weather import WeatherData
 
@@ -10,6 +15,29 @@ logger = logging.getLogger(__name__)
 
 BASE_URL = "https://api.openweathermap.org/data/2.5/weather"
 _REQUEST_TIMEOUT = 10.0
+# Keep idle connections for as long as a cached reading lives, so the
+# refresh after expiry skips the TCP/TLS handshake (httpx defaults to 5s).
+_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=4, max_connections=8, keepalive_expiry=300.0
+)
+# OWM refreshes current conditions roughly every 10 minutes
+_CACHE_TTL_SECONDS = 300.0
+# Distinct locations kept in the per-location cache; the oldest go first
+_LOCATION_CACHE_MAXSIZE = 128
+
+# Transient failures are retried with full-jitter exponential backoff
+_MAX_ATTEMPTS = 4
+_BACKOFF_BASE_SECONDS = 0.5
+_BACKOFF_MAX_SECONDS = 8.0
+_RETRYABLE_STATUSES = frozenset(
+    {httpx.codes.REQUEST_TIMEOUT, httpx.codes.TOO_MANY_REQUESTS}
+)
+
+# Built once so each response's fields are read in a single C-level call
+_MAIN_FIELDS = operator.itemgetter(
+    "temp", "feels_like", "humidity", "temp_max", "temp_min"
+)
+_CONDITION_FIELDS = operator.itemgetter("description", "icon")
 
 
 class WeatherService:
@@ -21,7 +49,14 @@ class WeatherService:
         city: Display name for the city.
     """
 
-    def __init__(self, api_key: str, lat: float, lon: float, city: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        lat: float,
+        lon: float,
+        city: str,
+        cache_ttl: float = _CACHE_TTL_SECONDS,
+    ) -> None:
         """Initialize the weather service.
 
         Args:
@@ -29,15 +64,57 @@ class WeatherService:
             lat: Latitude for the weather query.
             lon: Longitude for the weather query.
             city: Display name for the city.
+            cache_ttl: Seconds a reading is reused, for both the configured
+                coordinates and looked-up locations.
         """
         self._api_key = api_key
         self.lat = lat
         self.lon = lon
         self.city = city
+        # Query params never change per instance, so build them once
+        self._current_params: dict[str, str | float] = {
+            "lat": lat,
+            "lon": lon,
+            "appid": api_key,
+            "units": "imperial",
+        }
+        self._client: httpx.AsyncClient | None = None
+        self._cache: tuple[float, WeatherData] | None = None
+        self._cache_ttl = cache_ttl
+        self._lock = asyncio.Lock()
+        # Keyed on the normalized location; insertion order is fetch order
+        self._location_cache: dict[str, tuple[float, WeatherData]] = {}
+        # One lock per location with a fetch in flight
+        self._location_locks: dict[str, asyncio.Lock] = {}
+
+    async def aopen(self) -> None:
+        """Open the pooled HTTP client so later requests reuse connections."""
+        self._http_client()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one is open."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, creating it on first use.
+
+        Returns:
+            The shared AsyncClient for OpenWeatherMap requests.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=_REQUEST_TIMEOUT, limits=_POOL_LIMITS
+            )
+        return self._client
 
     async def get_current_weather(self) -> WeatherData:
         """Fetch current weather data for the configured coordinates.
 
+        Results are cached for a few minutes, and concurrent callers on a
+        cache miss share a single upstream request.
+
         Returns:
             A WeatherData instance with the current conditions.
 
@@ -45,18 +122,48 @@ class WeatherService:
             httpx.HTTPStatusError: If the API returns an error status.
             httpx.RequestError: If the request fails due to network issues.
         """
-        params: dict[str, str | float] = {
-            "lat": self.lat,
-            "lon": self.lon,
-            "appid": self._api_key,
-            "units": "imperial",
-        }
-        data = await self._fetch(params)
-        return self._build_weather_data(data, city=self.city)
+        cached = self._fresh(self._cache)
+        if cached is not None:
+            return cached
+        async with self._lock:
+            # Another caller may have refreshed the cache while we waited
+            cached = self._fresh(self._cache)
+            if cached is not None:
+                return cached
+            data = await self._fetch(self._current_params)
+            weather = self._build_weather_data(data, city=self.city)
+            self._cache = (time.monotonic(), weather)
+        return weather
+
+    def _fresh(self, entry: tuple[float, WeatherData] | None) -> WeatherData | None:
+        """Return the weather in a cache entry if it is younger than the TTL.
+
+        Args:
+            entry: A (fetched_at, weather) cache entry, or None.
+
+        Returns:
+            The cached WeatherData, or None if absent or expired.
+        """
+        if entry is None:
+            return None
+        fetched_at, weather = entry
+        if time.monotonic() - fetched_at >= self._cache_ttl:
+            return None
+        return weather
+
+    def invalidate(self) -> None:
+        """Drop every cached reading so the next lookups refetch."""
+        self._cache = None
+        self._location_cache.clear()
 
     async def get_weather_for_location(self, location: str) -> WeatherData:
         """Fetch current weather data for an arbitrary location string.
 
+        Results are cached per location for a few minutes, and concurrent
+        callers on a cache miss for the same location share a single
+        upstream request. Locations differing only in case or whitespace
+        share an entry.
+
         Args:
             location: Free-form location query, e.g. "Portland,OR".
 
@@ -65,6 +172,52 @@ class WeatherService:
             name comes from the API response when available, otherwise
             the requested location string.
 
+        Raises:
+            ValueError: If the API does not recognize the location.
+            httpx.HTTPStatusError: If the API returns any other error status.
+            httpx.RequestError: If the request fails due to network issues.
+        """
+        key = " ".join(location.split()).casefold()
+        cached = self._fresh(self._location_cache.get(key))
+        if cached is not None:
+            return cached
+        lock = self._location_locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another caller may have fetched this location while we waited
+                cached = self._fresh(self._location_cache.get(key))
+                if cached is not None:
+                    return cached
+                weather = await self._fetch_location(location)
+                self._store_location(key, weather)
+        finally:
+            # Only keep locks for fetches still in flight
+            if not lock.locked() and self._location_locks.get(key) is lock:
+                del self._location_locks[key]
+        return weather
+
+    def _store_location(self, key: str, weather: WeatherData) -> None:
+        """Cache a location's weather, evicting the oldest entry when full.
+
+        Args:
+            key: Normalized location key.
+            weather: Freshly fetched weather for the location.
+        """
+        # Re-insert so dict order stays oldest-fetched first
+        self._location_cache.pop(key, None)
+        self._location_cache[key] = (time.monotonic(), weather)
+        if len(self._location_cache) > _LOCATION_CACHE_MAXSIZE:
+            del self._location_cache[next(iter(self._location_cache))]
+
+    async def _fetch_location(self, location: str) -> WeatherData:
+        """Fetch current weather for a location string, bypassing the cache.
+
+        Args:
+            location: Free-form location query, e.g. "Portland,OR".
+
+        Returns:
+            A WeatherData instance with the current conditions.
+
         Raises:
             ValueError: If the API does not recognize the location.
             httpx.HTTPStatusError: If the API returns any other error status.
@@ -88,6 +241,9 @@ class WeatherService:
     async def _fetch(self, params: dict[str, str | float]) -> dict:
         """Call the OpenWeatherMap API and return the parsed JSON body.
 
+        Network errors, 408/429 and 5xx responses are retried up to
+        _MAX_ATTEMPTS times with jittered backoff, honoring Retry-After.
+
         Args:
             params: Query parameters for the current-weather endpoint.
 
@@ -100,20 +256,32 @@ class WeatherService:
         """
         # OWM requires the API key as a query param (not a header);
         # this is an upstream API constraint. HTTPS is enforced by BASE_URL.
-        try:
-            async with httpx.AsyncClient(
-                timeout=_REQUEST_TIMEOUT,
-            ) as client:
-                response = await client.get(BASE_URL, params=params)
+        attempt = 1
+        while True:
+            try:
+                response = await self._http_client().get(BASE_URL, params=params)
                 response.raise_for_status()
-                data: dict = response.json()
-        except httpx.HTTPStatusError:
-            logger.exception("Weather API HTTP error")
-            raise
-        except httpx.RequestError:
-            logger.exception("Weather API request failed")
-            raise
-        return data
+            except httpx.HTTPStatusError as exc:
+                delay = _retry_delay(attempt, exc.response)
+                if delay is None:
+                    logger.exception("Weather API HTTP error")
+                    raise
+            except httpx.TransportError:
+                delay = _retry_delay(attempt, None)
+                if delay is None:
+                    logger.exception("Weather API request failed")
+                    raise
+            except httpx.RequestError:
+                logger.exception("Weather API request failed")
+                raise
+            else:
+                data: dict = orjson.loads(response.content)
+                return data
+            logger.warning(
+                "Weather API attempt %d failed; retrying in %.2fs", attempt, delay
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
 
     @staticmethod
     def _build_weather_data(data: dict, *, city: str) -> WeatherData:
@@ -126,18 +294,46 @@ class WeatherService:
         Returns:
             A populated WeatherData instance.
         """
-        main = data["main"]
-        weather = data["weather"][0]
-        wind = data["wind"]
+        temp, feels_like, humidity, high, low = _MAIN_FIELDS(data["main"])
+        description, icon = _CONDITION_FIELDS(data["weather"][0])
 
         return WeatherData(
             city=city,
-            temp_f=float(main["temp"]),
-            feels_like_f=float(main["feels_like"]),
-            humidity=int(main["humidity"]),
-            description=str(weather["description"]),
-            wind_speed_mph=float(wind["speed"]),
-            high_f=float(main["temp_max"]),
-            low_f=float(main["temp_min"]),
-            icon=str(weather["icon"]),
+            temp_f=float(temp),
+            feels_like_f=float(feels_like),
+            humidity=int(humidity),
+            description=str(description),
+            wind_speed_mph=float(data["wind"]["speed"]),
+            high_f=float(high),
+            low_f=float(low),
+            icon=str(icon),
         )
+
+
+def _retry_delay(attempt: int, response: httpx.Response | None) -> float | None:
+    """Return how long to wait before retrying a failed request.
+
+    Args:
+        attempt: The 1-based number of the attempt that just failed.
+        response: The error response, or None for a transport failure.
+
+    Returns:
+        Seconds to sleep before the next attempt, or None if the failure
+        is not retryable or the attempts are exhausted.
+    """
+    if attempt >= _MAX_ATTEMPTS:
+        return None
+    if response is not None:
+        status = response.status_code
+        if status < 500 and status not in _RETRYABLE_STATUSES:
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                seconds = float(retry_after)
+            except ValueError:
+                pass  # HTTP-date form; fall back to our own backoff
+            else:
+                return seconds if seconds <= _BACKOFF_MAX_SECONDS else None
+    ceiling = min(_BACKOFF_MAX_SECONDS, _BACKOFF_BASE_SECONDS * 2 ** (attempt - 1))
+    return random.uniform(0.0, ceiling)  # nosec B311 - jitter, not crypto